@@ -26,7 +26,7 @@ except ImportError:
     MENU_AVAILABLE = False
 
 from src.core import PromptBuilder
-from src.services.token_counter import TokenCounter
+from src.services.token_counter import get_token_counter
 from src.services.llm.config import LLMConfig
 from src.services.llm.client import LLMClient
 
@@ -71,7 +71,7 @@ class PromptBuilderApp:
         # Core services
         self.api_config = LLMConfig()
         self.llm_client = LLMClient(self.api_config)
-        self.token_counter = TokenCounter()
+        self.token_counter = get_token_counter()
         self.prompt_builder = PromptBuilder()
         self.history = HistoryService()
         self.analytics = PromptAnalytics()
@@ -173,7 +173,7 @@ class PromptBuilderApp:
         
         try:
             # Check if feature requires API key
-            if feature.manifest.requires_api_key and not self.api_config.has_any_provider():
+            if feature.manifest.requires_api_key and not (self.state.llm_client and self.api_config.has_any_provider()):
                 if RICH_AVAILABLE:
                     console.print(Panel(
                         "[yellow]No API keys configured![/]\n\n"
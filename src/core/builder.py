@@ -41,8 +41,7 @@ class PromptBuilder:
         lines.append("\nLet's work through this carefully:")
         if config.constraints:
             lines.append("\nConstraints to consider:")
-            for c in config.constraints:
-                lines.append(f"- {c}")
+            lines.append(config.rendered_constraints)
         return "\n".join(lines)
 
     def _build_few_shot(self, config: PromptConfig) -> str:
@@ -74,8 +73,7 @@ class PromptBuilder:
         lines.append("- Clear explanations")
         if config.constraints:
             lines.append("\nKeep in mind:")
-            for c in config.constraints:
-                lines.append(f"- {c}")
+            lines.append(config.rendered_constraints)
         return "\n".join(lines)
 
     def _build_structured(self, config: PromptConfig) -> str:
@@ -92,8 +90,7 @@ class PromptBuilder:
         lines.append("- Complete information")
         if config.constraints:
             lines.append("\nRequirements:")
-            for c in config.constraints:
-                lines.append(f"- {c}")
+            lines.append(config.rendered_constraints)
         return "\n".join(lines)
 
     def _build_react(self, config: PromptConfig) -> str:
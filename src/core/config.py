@@ -15,3 +15,15 @@ class PromptConfig:
     output_format: str = ""
     constraints: list[str] = field(default_factory=list)
     temperature_hint: str = "balanced"
+    # (constraints snapshot, rendered block) - reused across techniques
+    _rendered_constraints: tuple[tuple[str, ...], str] = field(default=((), ""), init=False, repr=False, compare=False)
+
+    @property
+    def rendered_constraints(self) -> str:
+        """Constraints as a "- item" block, re-rendered only when they change."""
+        key = tuple(self.constraints)
+        cached_key, rendered = self._rendered_constraints
+        if key != cached_key:
+            rendered = "\n".join(f"- {c}" for c in key)
+            self._rendered_constraints = (key, rendered)
+        return rendered
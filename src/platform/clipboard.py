@@ -2,8 +2,10 @@
 Clipboard utilities for cross-platform clipboard access.
 """
 
+import shutil
 import subprocess
 import platform
+from functools import lru_cache
 
 try:
     import pyperclip
@@ -12,6 +14,18 @@ except ImportError:
     PYPERCLIP_AVAILABLE = False
 
 
+_LINUX_COMMANDS = (
+    ("xclip", "-selection", "clipboard"),
+    ("xsel", "--clipboard", "--input"),
+)
+
+
+@lru_cache(maxsize=1)
+def _linux_clipboard_commands() -> tuple[tuple[str, ...], ...]:
+    """Installed Linux clipboard tools in preference order, looked up once."""
+    return tuple(cmd for cmd in _LINUX_COMMANDS if shutil.which(cmd[0]))
+
+
 def copy_to_clipboard(text: str) -> bool:
     """
     Copy text to clipboard.
@@ -38,10 +52,12 @@ def copy_to_clipboard(text: str) -> bool:
             return process.returncode == 0
         
         elif system == "Linux":
-            for cmd in [["xclip", "-selection", "clipboard"], ["xsel", "--clipboard", "--input"]]:
+            # Encode once; the same bytes go to whichever tool is installed
+            data = text.encode("utf-8")
+            for cmd in _linux_clipboard_commands():
                 try:
                     process = subprocess.Popen(cmd, stdin=subprocess.PIPE, close_fds=True)
-                    process.communicate(input=text.encode("utf-8"))
+                    process.communicate(input=data)
                     if process.returncode == 0:
                         return True
                 except FileNotFoundError:
@@ -69,13 +85,7 @@ def is_clipboard_available() -> bool:
     if system == "Darwin":
         return True
     elif system == "Linux":
-        for cmd in ["xclip", "xsel"]:
-            try:
-                subprocess.run([cmd, "--version"], capture_output=True)
-                return True
-            except FileNotFoundError:
-                continue
-        return False
+        return bool(_linux_clipboard_commands())
     elif system == "Windows":
         return True
     
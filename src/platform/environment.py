@@ -3,6 +3,7 @@ Environment utilities - paths, directories, environment variables.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -15,8 +16,9 @@ except ImportError:
 APP_NAME = "promptbuilder"
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
-    """Get the configuration directory path."""
+    """Get the configuration directory path (created once per process)."""
     config_dir = Path.home() / f".{APP_NAME}"
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir
@@ -0,0 +1,21 @@
+"""
+Terminal input helpers shared by interactive features.
+"""
+
+
+def read_lines(console) -> list[str]:
+    """Read lines from console until a blank line (or end of input).
+    
+    Reads through console.input() so prompts and echo go through the
+    caller's Rich console. The blank line that ends input is not returned.
+    """
+    lines = []
+    while True:
+        try:
+            line = console.input()
+        except EOFError:
+            break
+        if not line.strip():
+            break
+        lines.append(line)
+    return lines
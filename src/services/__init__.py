@@ -2,8 +2,8 @@
 Services module - shared services used across features.
 """
 
-from .token_counter import TokenCounter
+from .token_counter import TokenCounter, get_token_counter
 from .export import ExportService, ExportFormat
 from .context import ContextManager
 
-__all__ = ["TokenCounter", "ExportService", "ExportFormat", "ContextManager"]
+__all__ = ["TokenCounter", "get_token_counter", "ExportService", "ExportFormat", "ContextManager"]
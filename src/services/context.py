@@ -3,11 +3,15 @@ Context Window Manager - Handle long contexts intelligently.
 Feature #7: Context Window Manager
 """
 
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Optional
+import hashlib
 import re
 
-from .token_counter import TokenCounter
+from .token_counter import TokenCounter, get_token_counter
 
 
 @dataclass
@@ -46,19 +50,86 @@ MODEL_LIMITS = {
     "gemini-3-pro-preview": 1000000,
 }
 
+# Family prefixes for dated or newer model IDs not listed above.
+# Checked in order, so longer prefixes must come before shorter ones.
+_MODEL_FAMILY_LIMITS = [
+    ("gpt-4.1", 1000000),
+    ("gpt-4o", 120000),
+    ("gpt-4-turbo", 120000),
+    ("o4", 190000),
+    ("o3", 190000),
+    ("claude-sonnet-4", 190000),
+    ("claude-opus-4", 190000),
+    ("claude-haiku-4", 190000),
+    ("claude-3", 190000),
+    ("gemini-3", 1000000),
+    ("gemini-2.5", 1000000),
+    ("gemini-2.0", 1000000),
+]
+
 DEFAULT_LIMIT = 8000
 
+# Blank-line runs separating paragraphs
+_PARA_RE = re.compile(r"\n{2,}")
+
+# Effective limits keyed by (model, reserve_output)
+_EFFECTIVE_LIMITS: dict[tuple[str, int], int] = {}
+
+
+def _model_limit(model: str) -> int:
+    """Context size for a model, falling back to its family's size."""
+    limit = MODEL_LIMITS.get(model)
+    if limit is not None:
+        return limit
+    for prefix, family_limit in _MODEL_FAMILY_LIMITS:
+        if model.startswith(prefix):
+            return family_limit
+    return DEFAULT_LIMIT
+
+
+# Max (encoding, content digest) entries kept per ContextManager for message counts
+MESSAGE_CACHE_SIZE = 2048
+
 
 class ContextManager:
     """Manage context windows for LLM interactions."""
 
     def __init__(self, token_counter: TokenCounter = None):
-        self.counter = token_counter or TokenCounter()
+        self.counter = token_counter or get_token_counter()
+        self._sep_tokens: dict[str, int] = {}
+        self._message_tokens: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+
+    def _message_token_count(self, content: str, model: str) -> int:
+        """Token count for a message body, cached by encoding and content digest."""
+        key = (
+            self.counter._encoding_for(model),
+            hashlib.blake2b(content.encode(), digest_size=8).digest(),
+        )
+        cache = self._message_tokens
+        tokens = cache.get(key)
+        if tokens is not None:
+            cache.move_to_end(key)
+            return tokens
+        tokens = cache[key] = self.counter.count_tokens(content, model)
+        if len(cache) > MESSAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return tokens
+
+    def _separator_tokens(self, model: str) -> int:
+        """Token cost of the paragraph separator, cached per model."""
+        tokens = self._sep_tokens.get(model)
+        if tokens is None:
+            tokens = self._sep_tokens[model] = self.counter.count_tokens("\n\n", model)
+        return tokens
 
     def get_limit(self, model: str, reserve_output: int = 4096) -> int:
         """Get context limit for a model, reserving space for output."""
-        limit = MODEL_LIMITS.get(model, DEFAULT_LIMIT)
-        return max(limit - reserve_output, 1000)
+        key = (model, reserve_output)
+        limit = _EFFECTIVE_LIMITS.get(key)
+        if limit is None:
+            limit = max(_model_limit(model) - reserve_output, 1000)
+            _EFFECTIVE_LIMITS[key] = limit
+        return limit
 
     def check_context(
         self,
@@ -80,20 +151,27 @@ class ContextManager:
         overlap: int = 200,
         model: str = "gpt-4o"
     ) -> list[ContextChunk]:
-        """Split content into overlapping chunks."""
+        """Split content into overlapping chunks.
+        
+        ContextChunk.tokens is summed from per-paragraph and separator counts,
+        so it is an approximation: BPE merges across boundaries can make it
+        drift from a full recount by about one token per paragraph.
+        """
         chunks = []
         
         # Split by paragraphs first
-        paragraphs = content.split("\n\n")
-        current_chunk = ""
+        paragraphs = [p for p in _PARA_RE.split(content) if p]
+        current_parts: list[str] = []
         current_tokens = 0
         chunk_index = 0
+        sep_tokens = self._separator_tokens(model)
         
         for para in paragraphs:
             para_tokens = self.counter.count_tokens(para, model)
             
-            if current_tokens + para_tokens > chunk_size and current_chunk:
+            if current_tokens + para_tokens > chunk_size and current_parts:
                 # Save current chunk
+                current_chunk = "\n\n".join(current_parts)
                 chunks.append(ContextChunk(
                     content=current_chunk.strip(),
                     tokens=current_tokens,
@@ -103,21 +181,27 @@ class ContextManager:
                 
                 # Start new chunk with overlap
                 if overlap > 0:
-                    # Take last part of previous chunk
+                    # Take last part of previous chunk; only the overlap is re-tokenized
                     words = current_chunk.split()
-                    overlap_words = words[-overlap:] if len(words) > overlap else words
-                    current_chunk = " ".join(overlap_words) + "\n\n" + para
+                    overlap_text = " ".join(words[-overlap:])
+                    current_parts = [overlap_text, para]
+                    current_tokens = (
+                        self.counter.count_tokens(overlap_text, model) + sep_tokens + para_tokens
+                    )
                 else:
-                    current_chunk = para
-                current_tokens = self.counter.count_tokens(current_chunk, model)
+                    current_parts = [para]
+                    current_tokens = para_tokens
+            elif current_parts:
+                current_parts.append(para)
+                current_tokens += sep_tokens + para_tokens
             else:
-                current_chunk += "\n\n" + para if current_chunk else para
-                current_tokens += para_tokens
+                current_parts = [para]
+                current_tokens = para_tokens
         
         # Add final chunk
-        if current_chunk:
+        if current_parts:
             chunks.append(ContextChunk(
-                content=current_chunk.strip(),
+                content="\n\n".join(current_parts).strip(),
                 tokens=current_tokens,
                 index=chunk_index
             ))
@@ -142,47 +226,12 @@ class ContextManager:
                 was_truncated=False
             )
         
-        # Need to truncate
-        words = content.split()
-        
-        if strategy == "end":
-            # Keep beginning
-            truncated = ""
-            for i, word in enumerate(words):
-                test = truncated + " " + word if truncated else word
-                if self.counter.count_tokens(test, model) > limit - 50:  # Leave buffer
-                    truncated += "\n\n[... content truncated ...]"
-                    break
-                truncated = test
-        
-        elif strategy == "start":
-            # Keep end
-            truncated = ""
-            for word in reversed(words):
-                test = word + " " + truncated if truncated else word
-                if self.counter.count_tokens(test, model) > limit - 50:
-                    truncated = "[... content truncated ...]\n\n" + truncated
-                    break
-                truncated = test
-        
-        else:  # middle
-            # Keep beginning and end
-            half_limit = (limit - 100) // 2
-            beginning = ""
-            for word in words:
-                test = beginning + " " + word if beginning else word
-                if self.counter.count_tokens(test, model) > half_limit:
-                    break
-                beginning = test
-            
-            ending = ""
-            for word in reversed(words):
-                test = word + " " + ending if ending else word
-                if self.counter.count_tokens(test, model) > half_limit:
-                    break
-                ending = test
-            
-            truncated = beginning + "\n\n[... content truncated ...]\n\n" + ending
+        # Need to truncate - slice the token ids when a tokenizer is available
+        ids = self.counter.encode(content, model)
+        if ids is not None:
+            truncated = self._truncate_tokens(ids, model, limit, strategy)
+        else:
+            truncated = self._truncate_words(content, model, limit, strategy)
         
         final_tokens = self.counter.count_tokens(truncated, model)
         
@@ -193,6 +242,57 @@ class ContextManager:
             was_truncated=True
         )
 
+    def _truncate_tokens(self, ids: list[int], model: str, limit: int, strategy: str) -> str:
+        """Truncate by slicing an already-encoded token list.
+        
+        A cut can land inside a multi-byte character; tiktoken decodes the
+        partial bytes as U+FFFD, so the edges may carry a replacement char.
+        """
+        if strategy == "end":
+            # Keep beginning
+            return self.counter.decode(ids[:limit - 50], model) + "\n\n[... content truncated ...]"
+        
+        if strategy == "start":
+            # Keep end
+            return "[... content truncated ...]\n\n" + self.counter.decode(ids[-(limit - 50):], model)
+        
+        # middle - keep beginning and end
+        half_limit = (limit - 100) // 2
+        beginning = self.counter.decode(ids[:half_limit], model)
+        ending = self.counter.decode(ids[-half_limit:], model) if half_limit > 0 else ""
+        return beginning + "\n\n[... content truncated ...]\n\n" + ending
+
+    def _truncate_words(self, content: str, model: str, limit: int, strategy: str) -> str:
+        """Truncate on word boundaries when no tokenizer is available.
+        
+        Each word is charged its own tokens plus one for the joining space,
+        which over-estimates slightly instead of re-counting the joined text.
+        Prefix sums of those costs let every split point be found by bisection.
+        """
+        words = content.split()
+        word_tokens = self.counter.count_tokens_batch(words, model)
+        prefix = [0, *accumulate(n + 1 for n in word_tokens)]
+        
+        if strategy == "end":
+            # Keep beginning
+            stop = bisect_right(prefix, limit - 50) - 1  # Leave buffer
+            return " ".join(words[:stop]) + "\n\n[... content truncated ...]"
+        
+        if strategy == "start":
+            # Keep end
+            start = bisect_left(prefix, prefix[-1] - (limit - 50))
+            return "[... content truncated ...]\n\n" + " ".join(words[start:])
+        
+        # middle - keep beginning and end
+        half_limit = (limit - 100) // 2
+        stop = bisect_right(prefix, half_limit) - 1
+        start = bisect_left(prefix, prefix[-1] - half_limit)
+        return (
+            " ".join(words[:stop])
+            + "\n\n[... content truncated ...]\n\n"
+            + " ".join(words[start:])
+        )
+
     def summarize_for_context(
         self,
         content: str,
@@ -219,6 +319,9 @@ Summary:"""
         """
         Manage conversation history to fit in context.
         Keeps most recent messages, summarizes older ones if needed.
+        
+        Message token counts are cached on the manager, so repeat calls over
+        a growing history only tokenize new messages.
         """
         limit = self.get_limit(model)
         
@@ -226,7 +329,7 @@ Summary:"""
         total_tokens = 0
         message_tokens = []
         for msg in messages:
-            tokens = self.counter.count_tokens(msg.get("content", ""), model)
+            tokens = self._message_token_count(msg.get("content", ""), model)
             message_tokens.append(tokens)
             total_tokens += tokens
         
@@ -234,12 +337,13 @@ Summary:"""
             return messages if not max_messages else messages[-max_messages:]
         
         # Need to trim - keep system message and recent messages
-        result = []
+        head = []
+        recent = deque()
         current_tokens = 0
         
         # Always keep system message if present
         if messages and messages[0].get("role") == "system":
-            result.append(messages[0])
+            head.append(messages[0])
             current_tokens += message_tokens[0]
             messages = messages[1:]
             message_tokens = message_tokens[1:]
@@ -248,15 +352,15 @@ Summary:"""
         for msg, tokens in zip(reversed(messages), reversed(message_tokens)):
             if current_tokens + tokens > limit:
                 # Add truncation notice
-                result.insert(1 if result and result[0].get("role") == "system" else 0, {
+                recent.appendleft({
                     "role": "system",
                     "content": "[Earlier conversation history truncated due to length]"
                 })
                 break
-            result.insert(1 if result and result[0].get("role") == "system" else 0, msg)
+            recent.appendleft(msg)
             current_tokens += tokens
         
-        return result
+        return head + list(recent)
 
     def estimate_response_tokens(
         self,
@@ -6,7 +6,13 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class ExportFormat(Enum):
@@ -43,6 +49,18 @@ FORMAT_INFO = {
     ExportFormat.TEXT: ("Plain Text", ".txt"),
 }
 
+_FORMAT_KEY_MAP = {fmt.value: fmt for fmt in ExportFormat}
+
+# Doubles braces so LangChain treats them as literals
+_BRACE_TABLE = str.maketrans({"{": "{{", "}": "}}"})
+
+
+def _dumps(data: dict) -> str:
+    """Serialize export data as indented JSON, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 class ExportService:
     """Export prompts in various formats."""
@@ -50,18 +68,7 @@ class ExportService:
     @staticmethod
     def export(prompt: str, format: ExportFormat, metadata: Optional[ExportMetadata] = None) -> tuple[str, str]:
         """Export prompt in specified format. Returns (content, extension)."""
-        exporters = {
-            ExportFormat.JSON: ExportService._to_json,
-            ExportFormat.OPENAI: ExportService._to_openai,
-            ExportFormat.ANTHROPIC: ExportService._to_anthropic,
-            ExportFormat.MARKDOWN: ExportService._to_markdown,
-            ExportFormat.LANGCHAIN: ExportService._to_langchain,
-            ExportFormat.LLAMAINDEX: ExportService._to_llamaindex,
-            ExportFormat.PROMPT_FILE: ExportService._to_prompt_file,
-            ExportFormat.TEXT: ExportService._to_text,
-        }
-        
-        exporter = exporters.get(format, ExportService._to_text)
+        exporter = ExportService._EXPORTERS.get(format, ExportService._to_text)
         content = exporter(prompt, metadata)
         _, extension = FORMAT_INFO.get(format, ("Text", ".txt"))
         
@@ -77,19 +84,19 @@ class ExportService:
                 "created_at": metadata.created_at,
                 "tags": metadata.tags
             }
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
     @staticmethod
     def _to_openai(prompt: str, metadata: Optional[ExportMetadata]) -> str:
-        return json.dumps({
+        return _dumps({
             "messages": [{"role": "user", "content": prompt}]
-        }, indent=2)
+        })
 
     @staticmethod
     def _to_anthropic(prompt: str, metadata: Optional[ExportMetadata]) -> str:
-        return json.dumps({
+        return _dumps({
             "messages": [{"role": "user", "content": prompt}]
-        }, indent=2)
+        })
 
     @staticmethod
     def _to_markdown(prompt: str, metadata: Optional[ExportMetadata]) -> str:
@@ -113,14 +120,14 @@ class ExportService:
 
     @staticmethod
     def _to_langchain(prompt: str, metadata: Optional[ExportMetadata]) -> str:
-        escaped = prompt.replace("{", "{{").replace("}", "}}")
+        escaped = prompt.translate(_BRACE_TABLE)
         data = {"_type": "prompt", "input_variables": [], "template": escaped}
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
     @staticmethod
     def _to_llamaindex(prompt: str, metadata: Optional[ExportMetadata]) -> str:
         data = {"prompt_type": "custom", "prompt_template": prompt}
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
     @staticmethod
     def _to_prompt_file(prompt: str, metadata: Optional[ExportMetadata]) -> str:
@@ -140,18 +147,19 @@ class ExportService:
     def _to_text(prompt: str, metadata: Optional[ExportMetadata]) -> str:
         return prompt
 
+    _EXPORTERS: dict[ExportFormat, Callable[[str, Optional[ExportMetadata]], str]] = {
+        ExportFormat.JSON: _to_json.__func__,
+        ExportFormat.OPENAI: _to_openai.__func__,
+        ExportFormat.ANTHROPIC: _to_anthropic.__func__,
+        ExportFormat.MARKDOWN: _to_markdown.__func__,
+        ExportFormat.LANGCHAIN: _to_langchain.__func__,
+        ExportFormat.LLAMAINDEX: _to_llamaindex.__func__,
+        ExportFormat.PROMPT_FILE: _to_prompt_file.__func__,
+        ExportFormat.TEXT: _to_text.__func__,
+    }
+
 
 def export_prompt(prompt: str, format_key: str, metadata: Optional[ExportMetadata] = None) -> tuple[str, str]:
     """Export a prompt in the specified format. Returns (content, extension)."""
-    format_map = {
-        "json": ExportFormat.JSON,
-        "openai": ExportFormat.OPENAI,
-        "anthropic": ExportFormat.ANTHROPIC,
-        "markdown": ExportFormat.MARKDOWN,
-        "langchain": ExportFormat.LANGCHAIN,
-        "llamaindex": ExportFormat.LLAMAINDEX,
-        "prompt": ExportFormat.PROMPT_FILE,
-        "txt": ExportFormat.TEXT,
-    }
-    fmt = format_map.get(format_key, ExportFormat.TEXT)
+    fmt = _FORMAT_KEY_MAP.get(format_key, ExportFormat.TEXT)
     return ExportService.export(prompt, fmt, metadata)
@@ -2,13 +2,52 @@
 LLM Client - unified interface for multiple LLM providers.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, contextmanager
+from functools import partial
+from typing import AsyncIterator, Iterator, Optional
 from dataclasses import dataclass
 import asyncio
+import threading
 
 from .config import LLMConfig
 
 
+# Worker threads for blocking SDK calls, so parallel completions don't queue
+# behind other users of the default executor
+SDK_THREADS = 16
+
+# Streamed chunks buffered between the SDK thread and the event loop
+STREAM_QUEUE_SIZE = 64
+
+# Completed responses kept for repeat deterministic requests
+RESPONSE_CACHE_SIZE = 256
+
+# Provider SDK client classes, resolved on first use; None if not installed
+_SDK_CLASSES: dict[str, Optional[type]] = {}
+_MISSING = object()
+
+
+def _load_sdk(provider: str) -> Optional[type]:
+    """Import a provider's client class once and remember the outcome."""
+    sdk = _SDK_CLASSES.get(provider, _MISSING)
+    if sdk is _MISSING:
+        try:
+            if provider == "openai":
+                from openai import OpenAI as sdk
+            elif provider == "anthropic":
+                from anthropic import Anthropic as sdk
+            elif provider == "google":
+                from google.genai import Client as sdk
+            else:
+                sdk = None
+        except ImportError:
+            sdk = None
+        _SDK_CLASSES[provider] = sdk
+    return sdk
+
+
 @dataclass
 class LLMResponse:
     content: str
@@ -16,53 +55,90 @@ class LLMResponse:
     provider: str
     input_tokens: int = 0
     output_tokens: int = 0
+    cached_tokens: int = 0
     error: Optional[str] = None
 
 
+def _no_provider_response() -> LLMResponse:
+    return LLMResponse(
+        content="", model="", provider="",
+        error="No API keys configured. Set OPENAI_API_KEY, ANTHROPIC_API_KEY, or GOOGLE_API_KEY."
+    )
+
+
 class LLMClient:
     """Unified client for OpenAI, Anthropic, and Google APIs."""
 
     def __init__(self, config: LLMConfig = None):
         self.config = config or LLMConfig()
         self._clients = {}
+        self._resp_cache: OrderedDict[tuple, LLMResponse] = OrderedDict()
+        self._pool = ThreadPoolExecutor(max_workers=SDK_THREADS, thread_name_prefix="llm")
+
+    def close(self) -> None:
+        """Shut down the SDK worker threads."""
+        self._pool.shutdown(wait=False)
+
+    def refresh(self, provider: Optional[str] = None) -> None:
+        """Pick up changed API keys for one provider, or all of them.
+
+        SDK clients that support ``with_options`` are re-keyed in place so
+        their HTTP connection pool and TLS context are reused; any other
+        client is dropped and rebuilt lazily on the next request.
+        """
+        names = [provider] if provider else list(self._clients)
+        for name in names:
+            sdk_client = self._clients.pop(name, None)
+            settings = self.config.get_provider(name)
+            if sdk_client is None or not (settings and settings.api_key):
+                continue
+            with_options = getattr(sdk_client, "with_options", None)
+            if with_options is not None:
+                self._clients[name] = with_options(api_key=settings.api_key)
+
+    async def _run_sync(self, fn, *args, **kwargs):
+        """Run a blocking SDK call on the client's thread pool."""
+        if kwargs:
+            fn = partial(fn, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
 
     def _get_openai_client(self):
         if "openai" not in self._clients:
-            try:
-                from openai import OpenAI
-                provider = self.config.get_provider("openai")
-                if provider and provider.api_key:
-                    self._clients["openai"] = OpenAI(
-                        api_key=provider.api_key,
-                        base_url=provider.base_url
-                    )
-            except ImportError:
-                pass
+            OpenAI = _load_sdk("openai")
+            provider = self.config.get_provider("openai")
+            if OpenAI and provider and provider.api_key:
+                self._clients["openai"] = OpenAI(
+                    api_key=provider.api_key,
+                    base_url=provider.base_url
+                )
         return self._clients.get("openai")
 
     def _get_anthropic_client(self):
         if "anthropic" not in self._clients:
-            try:
-                from anthropic import Anthropic
-                provider = self.config.get_provider("anthropic")
-                if provider and provider.api_key:
-                    self._clients["anthropic"] = Anthropic(api_key=provider.api_key)
-            except ImportError:
-                pass
+            Anthropic = _load_sdk("anthropic")
+            provider = self.config.get_provider("anthropic")
+            if Anthropic and provider and provider.api_key:
+                self._clients["anthropic"] = Anthropic(api_key=provider.api_key)
         return self._clients.get("anthropic")
 
     def _get_google_client(self):
         if "google" not in self._clients:
-            try:
-                from google import genai
-                provider = self.config.get_provider("google")
-                if provider and provider.api_key:
-                    client = genai.Client(api_key=provider.api_key)
-                    self._clients["google"] = client
-            except ImportError:
-                pass
+            Client = _load_sdk("google")
+            provider = self.config.get_provider("google")
+            if Client and provider and provider.api_key:
+                self._clients["google"] = Client(api_key=provider.api_key)
         return self._clients.get("google")
 
+    def _resolve_target(self, provider: Optional[str], model: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+        """Fill in the configured default provider and model where missing."""
+        if not provider or not model:
+            default_provider, default_model = self.config.get_default_model()
+            if not provider:
+                provider = default_provider
+            if not model:
+                model = default_model
+        return provider, model
+
     async def complete(
         self,
         prompt: str,
@@ -70,23 +146,35 @@ class LLMClient:
         model: str = None,
         system_prompt: str = None,
         max_tokens: int = 4096,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        cache: bool = False
     ) -> LLMResponse:
-        """Send a completion request to the specified provider."""
-        
-        if not provider or not model:
-            default_provider, default_model = self.config.get_default_model()
-            if not provider:
-                provider = default_provider
-            if not model:
-                model = default_model
+        """Send a completion request to the specified provider.
         
+        Responses are reused for identical requests when temperature is 0
+        or cache is set. Failed responses are never cached.
+        """
+        provider, model = self._resolve_target(provider, model)
         if not provider:
-            return LLMResponse(
-                content="", model="", provider="",
-                error="No API keys configured. Set OPENAI_API_KEY, ANTHROPIC_API_KEY, or GOOGLE_API_KEY."
-            )
+            return _no_provider_response()
+
+        key = None
+        if cache or temperature == 0:
+            key = (provider, model, system_prompt, prompt, max_tokens, temperature)
+            cached = self._resp_cache.get(key)
+            if cached is not None:
+                self._resp_cache.move_to_end(key)
+                return cached
+
+        response = await self._dispatch(prompt, provider, model, system_prompt, max_tokens, temperature)
 
+        if key is not None and not response.error:
+            self._resp_cache[key] = response
+            if len(self._resp_cache) > RESPONSE_CACHE_SIZE:
+                self._resp_cache.popitem(last=False)
+        return response
+
+    async def _dispatch(self, prompt, provider, model, system_prompt, max_tokens, temperature) -> LLMResponse:
         try:
             if provider == "openai":
                 return await self._complete_openai(prompt, model, system_prompt, max_tokens, temperature)
@@ -110,16 +198,20 @@ class LLMClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = await asyncio.to_thread(
+        response = await self._run_sync(
             client.chat.completions.create,
             model=model, messages=messages, max_tokens=max_tokens, temperature=temperature
         )
 
+        # OpenAI caches long prompt prefixes automatically and reports the hits
+        details = getattr(response.usage, "prompt_tokens_details", None)
+
         return LLMResponse(
             content=response.choices[0].message.content,
             model=model, provider="openai",
             input_tokens=response.usage.prompt_tokens if response.usage else 0,
-            output_tokens=response.usage.completion_tokens if response.usage else 0
+            output_tokens=response.usage.completion_tokens if response.usage else 0,
+            cached_tokens=(getattr(details, "cached_tokens", 0) or 0) if details else 0
         )
 
     async def _complete_anthropic(self, prompt, model, system_prompt, max_tokens, temperature) -> LLMResponse:
@@ -130,15 +222,19 @@ class LLMClient:
 
         kwargs = {"model": model, "max_tokens": max_tokens, "messages": [{"role": "user", "content": prompt}]}
         if system_prompt:
-            kwargs["system"] = system_prompt
+            # Mark the system prompt as a cacheable prefix for repeat requests
+            kwargs["system"] = [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ]
 
-        response = await asyncio.to_thread(client.messages.create, **kwargs)
+        response = await self._run_sync(client.messages.create, **kwargs)
 
         return LLMResponse(
             content=response.content[0].text,
             model=model, provider="anthropic",
             input_tokens=response.usage.input_tokens if response.usage else 0,
-            output_tokens=response.usage.output_tokens if response.usage else 0
+            output_tokens=response.usage.output_tokens if response.usage else 0,
+            cached_tokens=(getattr(response.usage, "cache_read_input_tokens", 0) or 0) if response.usage else 0
         )
 
     async def _complete_google(self, prompt, model, system_prompt, max_tokens, temperature) -> LLMResponse:
@@ -155,7 +251,7 @@ class LLMClient:
             temperature=temperature,
         )
         
-        response = await asyncio.to_thread(
+        response = await self._run_sync(
             client.models.generate_content,
             model=model,
             contents=contents,
@@ -172,3 +268,170 @@ class LLMClient:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
         )
+
+    async def stream(
+        self,
+        prompt: str,
+        provider: str = None,
+        model: str = None,
+        system_prompt: str = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7
+    ) -> AsyncIterator[LLMResponse]:
+        """Stream a completion as it is generated.
+        
+        Each yielded response carries the content received so far. The last
+        one also carries token usage, or an error if the request failed.
+        """
+        provider, model = self._resolve_target(provider, model)
+        if not provider:
+            yield _no_provider_response()
+            return
+
+        streamers = {
+            "openai": (self._get_openai_client, _stream_openai),
+            "anthropic": (self._get_anthropic_client, _stream_anthropic),
+            "google": (self._get_google_client, _stream_google),
+        }
+        if provider not in streamers:
+            yield LLMResponse(content="", model=model, provider=provider, error=f"Unknown provider: {provider}")
+            return
+
+        get_client, streamer = streamers[provider]
+        client = get_client()
+        if not client:
+            yield LLMResponse(content="", model=model, provider=provider,
+                              error=f"{provider} not available. Install its SDK and set an API key.")
+            return
+
+        parts = []
+        usage = (0, 0, 0)
+        try:
+            events = streamer(client, prompt, model, system_prompt, max_tokens, temperature)
+            async with aclosing(self._iterate_in_thread(events)) as items:
+                async for kind, value in items:
+                    if kind == "text":
+                        parts.append(value)
+                        yield LLMResponse(content="".join(parts), model=model, provider=provider)
+                    else:
+                        usage = value
+        except Exception as e:
+            yield LLMResponse(content="".join(parts), model=model, provider=provider, error=str(e))
+            return
+
+        input_tokens, output_tokens, cached_tokens = usage
+        yield LLMResponse(
+            content="".join(parts), model=model, provider=provider,
+            input_tokens=input_tokens, output_tokens=output_tokens, cached_tokens=cached_tokens
+        )
+
+    async def _iterate_in_thread(self, items: Iterator) -> AsyncIterator:
+        """Drain a blocking iterator on the thread pool, at most STREAM_QUEUE_SIZE items ahead."""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        slots = threading.Semaphore(STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        done = object()
+
+        def pump():
+            try:
+                for item in items:
+                    slots.acquire()
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                # Close the stream here, on the thread that was reading it, so
+                # an early exit releases the SDK connection
+                close = getattr(items, "close", None)
+                try:
+                    if close:
+                        close()
+                finally:
+                    loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        worker = loop.run_in_executor(self._pool, pump)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                slots.release()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Wake the pump if the consumer stopped early, and let it finish
+            stop.set()
+            slots.release()
+            await worker
+
+
+@contextmanager
+def _closing_stream(stream):
+    """Close an SDK stream once the generator reading it stops, if it has close()."""
+    try:
+        yield stream
+    finally:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+
+
+def _stream_openai(client, prompt, model, system_prompt, max_tokens, temperature) -> Iterator[tuple]:
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+
+    chunks = client.chat.completions.create(
+        model=model, messages=messages, max_tokens=max_tokens, temperature=temperature,
+        stream=True, stream_options={"include_usage": True}
+    )
+    with _closing_stream(chunks):
+        for chunk in chunks:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield "text", chunk.choices[0].delta.content
+            if chunk.usage:
+                details = getattr(chunk.usage, "prompt_tokens_details", None)
+                cached = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+                yield "usage", (chunk.usage.prompt_tokens, chunk.usage.completion_tokens, cached)
+
+
+def _stream_anthropic(client, prompt, model, system_prompt, max_tokens, temperature) -> Iterator[tuple]:
+    kwargs = {"model": model, "max_tokens": max_tokens, "messages": [{"role": "user", "content": prompt}]}
+    if system_prompt:
+        kwargs["system"] = [
+            {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+        ]
+
+    with client.messages.stream(**kwargs) as stream:
+        for text in stream.text_stream:
+            yield "text", text
+        usage = stream.get_final_message().usage
+    if usage:
+        yield "usage", (usage.input_tokens, usage.output_tokens, getattr(usage, "cache_read_input_tokens", 0) or 0)
+
+
+def _stream_google(client, prompt, model, system_prompt, max_tokens, temperature) -> Iterator[tuple]:
+    from google.genai import types
+
+    contents = f"{system_prompt}\n\n{prompt}" if system_prompt else prompt
+    config = types.GenerateContentConfig(
+        max_output_tokens=max_tokens,
+        temperature=temperature,
+    )
+
+    usage = None
+    chunks = client.models.generate_content_stream(model=model, contents=contents, config=config)
+    with _closing_stream(chunks):
+        for chunk in chunks:
+            if chunk.text:
+                yield "text", chunk.text
+            if chunk.usage_metadata:
+                usage = chunk.usage_metadata
+    if usage:
+        yield "usage", (usage.prompt_token_count or 0, usage.candidates_token_count or 0,
+                        getattr(usage, "cached_content_token_count", 0) or 0)
@@ -4,14 +4,21 @@ LLM configuration - manage API keys and provider settings.
 
 import os
 import json
+import tempfile
 from dataclasses import dataclass, field
 from typing import Optional
 from pathlib import Path
 
-from ...platform.environment import get_config_dir, get_env
+from ...platform.environment import get_config_dir
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+@dataclass(slots=True)
 class ProviderConfig:
     name: str
     api_key: Optional[str]
@@ -50,6 +57,30 @@ PROVIDERS = {
 }
 
 
+# Parsed config files keyed by path, with the (mtime_ns, size) they were read at
+_FILE_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
+
+def _read_config_file(path: Path) -> dict:
+    """Parse a JSON config file, reusing the last parse while the file is unchanged."""
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    
+    cached = _FILE_CACHE.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    
+    try:
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except Exception:
+        data = {}
+    _FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 class LLMConfig:
     """Manage API keys for multiple LLM providers."""
 
@@ -58,25 +89,33 @@ class LLMConfig:
         self.providers: dict[str, ProviderConfig] = {}
         self.default_provider: Optional[str] = None
         self.default_model: Optional[str] = None
+        self._cached_default: Optional[tuple[Optional[str], Optional[str]]] = None
+        self._cached_available: Optional[list[str]] = None
+        self._cached_models: Optional[list[tuple[str, str]]] = None
+        # Bumped whenever keys or defaults change, so callers can memoize views
+        self.revision = 0
         self._load_config()
 
+    def _invalidate_cache(self) -> None:
+        """Drop memoized lookups after keys or defaults change."""
+        self.revision += 1
+        self._cached_default = None
+        self._cached_available = None
+        self._cached_models = None
+
     def _load_config(self) -> None:
         """Load API keys from environment and config file."""
-        file_config = {}
-        if self.config_path.exists():
-            try:
-                with open(self.config_path) as f:
-                    file_config = json.load(f)
-            except Exception:
-                pass
+        file_config = _read_config_file(self.config_path)
 
         # Load default model settings
         self.default_provider = file_config.get("default_provider")
         self.default_model = file_config.get("default_model")
 
+        env = os.environ
         for name, info in PROVIDERS.items():
-            api_key = get_env(info["env_key"]) or file_config.get(name, {}).get("api_key")
-            base_url = file_config.get(name, {}).get("base_url")
+            provider_file = file_config.get(name, {})
+            api_key = env.get(info["env_key"]) or provider_file.get("api_key")
+            base_url = provider_file.get("base_url")
             
             self.providers[name] = ProviderConfig(
                 name=name,
@@ -85,9 +124,17 @@ class LLMConfig:
                 models=info["models"],
                 is_available=bool(api_key)
             )
+        
+        # Model lists stay ordered for display; sets answer membership checks
+        self._models_set = {name: frozenset(p.models) for name, p in self.providers.items()}
+        self._invalidate_cache()
 
     def save_config(self):
         """Save current config to file."""
+        self._invalidate_cache()
+        self._write_config()
+
+    def _write_config(self) -> None:
         config = {}
         for name, provider in self.providers.items():
             if provider.api_key:
@@ -102,9 +149,22 @@ class LLMConfig:
         if self.default_model:
             config["default_model"] = self.default_model
         
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        else:
+            data = (json.dumps(config, indent=2) + "\n").encode()
+        
+        # Write beside the target and swap in, so readers never see a partial file
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent, prefix=".api_config.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        _FILE_CACHE.pop(self.config_path, None)
 
     def set_api_key(self, provider: str, api_key: str, base_url: str = None):
         """Set API key for a provider."""
@@ -116,21 +176,30 @@ class LLMConfig:
         if base_url:
             self.providers[provider].base_url = base_url
         
-        self.save_config()
+        self._invalidate_cache()
+        self._write_config()
 
     def set_default_model(self, provider: str, model: str):
         """Set the default provider and model."""
         if provider not in self.providers:
             raise ValueError(f"Unknown provider: {provider}")
-        if model not in self.providers[provider].models:
+        if model not in self._models_set[provider]:
             raise ValueError(f"Unknown model: {model}")
         
         self.default_provider = provider
         self.default_model = model
-        self.save_config()
+        # Only the default changed; available providers/models stay memoized
+        self._cached_default = None
+        self.revision += 1
+        self._write_config()
 
     def get_default_model(self) -> tuple[Optional[str], Optional[str]]:
         """Get the default provider and model."""
+        if self._cached_default is None:
+            self._cached_default = self._resolve_default_model()
+        return self._cached_default
+
+    def _resolve_default_model(self) -> tuple[Optional[str], Optional[str]]:
         # Return configured default if valid
         if self.default_provider and self.default_model:
             if self.providers.get(self.default_provider, ProviderConfig("", None)).is_available:
@@ -147,16 +216,20 @@ class LLMConfig:
 
     def get_available_providers(self) -> list[str]:
         """Get list of providers with valid API keys."""
-        return [name for name, p in self.providers.items() if p.is_available]
+        if self._cached_available is None:
+            self._cached_available = [name for name, p in self.providers.items() if p.is_available]
+        return self._cached_available
 
     def get_available_models(self) -> list[tuple[str, str]]:
         """Get all available models as (provider, model) tuples."""
-        models = []
-        for name, provider in self.providers.items():
-            if provider.is_available:
-                for model in provider.models:
-                    models.append((name, model))
-        return models
+        if self._cached_models is None:
+            models = []
+            for name, provider in self.providers.items():
+                if provider.is_available:
+                    for model in provider.models:
+                        models.append((name, model))
+            self._cached_models = models
+        return self._cached_models
 
     def get_provider(self, name: str) -> Optional[ProviderConfig]:
         """Get provider config by name."""
@@ -164,7 +237,7 @@ class LLMConfig:
 
     def has_any_provider(self) -> bool:
         """Check if at least one provider is configured."""
-        return any(p.is_available for p in self.providers.values())
+        return bool(self.get_available_providers())
 
     def has_multiple_providers(self) -> bool:
         """Check if multiple providers are configured."""
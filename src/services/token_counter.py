@@ -2,8 +2,14 @@
 Token counting and cost estimation service.
 """
 
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from dataclasses import dataclass
-from typing import Optional
+from typing import NamedTuple, Optional
 
 try:
     import tiktoken
@@ -12,7 +18,7 @@ except ImportError:
     TIKTOKEN_AVAILABLE = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenEstimate:
     token_count: int
     model: str
@@ -27,25 +33,38 @@ class TokenEstimate:
         return f"${self.input_cost:.3f}"
 
 
-# Pricing per 1K tokens (updated January 2026, derived from per-1M pricing)
-# Formula: price_per_1k = price_per_1M / 1000
+class Pricing(NamedTuple):
+    input_microcents: int
+    output_microcents: int
+    encoding: str
+    provider: str
+
+
+# Integer units keep cost math exact; costs become dollars only in TokenEstimate
+MICROCENTS_PER_DOLLAR = 100_000_000
+
+# Pricing in micro-cents (1e-8 USD) per token (updated January 2026)
+# Formula: microcents_per_token = price_per_1M * 100
 MODEL_PRICING = {
     # OpenAI models (per 1M: gpt-4.1=$2/$8, mini=$0.40/$1.60, nano=$0.10/$0.40, o4-mini=$1.10/$4.40, gpt-4o=$2.50/$10)
-    "gpt-4.1": {"input": 0.002, "output": 0.008, "encoding": "o200k_base", "provider": "openai"},
-    "gpt-4.1-mini": {"input": 0.0004, "output": 0.0016, "encoding": "o200k_base", "provider": "openai"},
-    "gpt-4.1-nano": {"input": 0.0001, "output": 0.0004, "encoding": "o200k_base", "provider": "openai"},
-    "o4-mini": {"input": 0.0011, "output": 0.0044, "encoding": "o200k_base", "provider": "openai"},
-    "gpt-4o": {"input": 0.0025, "output": 0.01, "encoding": "o200k_base", "provider": "openai"},
+    "gpt-4.1": Pricing(200, 800, "o200k_base", "openai"),
+    "gpt-4.1-mini": Pricing(40, 160, "o200k_base", "openai"),
+    "gpt-4.1-nano": Pricing(10, 40, "o200k_base", "openai"),
+    "o4-mini": Pricing(110, 440, "o200k_base", "openai"),
+    "gpt-4o": Pricing(250, 1000, "o200k_base", "openai"),
     # Anthropic models (per 1M: sonnet=$3/$15, opus=$5/$25, haiku=$1/$5)
-    "claude-sonnet-4-5-20250929": {"input": 0.003, "output": 0.015, "encoding": "cl100k_base", "provider": "anthropic"},
-    "claude-opus-4-5-20251124": {"input": 0.005, "output": 0.025, "encoding": "cl100k_base", "provider": "anthropic"},
-    "claude-haiku-4-5-20251015": {"input": 0.001, "output": 0.005, "encoding": "cl100k_base", "provider": "anthropic"},
+    "claude-sonnet-4-5-20250929": Pricing(300, 1500, "cl100k_base", "anthropic"),
+    "claude-opus-4-5-20251124": Pricing(500, 2500, "cl100k_base", "anthropic"),
+    "claude-haiku-4-5-20251015": Pricing(100, 500, "cl100k_base", "anthropic"),
     # Google models (per 1M: pro=$1.25/$10, flash=$0.30/$2.50, flash-lite=$0.10/$0.40)
-    "gemini-2.5-pro": {"input": 0.00125, "output": 0.01, "encoding": "cl100k_base", "provider": "google"},
-    "gemini-2.5-flash": {"input": 0.0003, "output": 0.0025, "encoding": "cl100k_base", "provider": "google"},
-    "gemini-2.5-flash-lite": {"input": 0.0001, "output": 0.0004, "encoding": "cl100k_base", "provider": "google"},
+    "gemini-2.5-pro": Pricing(125, 1000, "cl100k_base", "google"),
+    "gemini-2.5-flash": Pricing(30, 250, "cl100k_base", "google"),
+    "gemini-2.5-flash-lite": Pricing(10, 40, "cl100k_base", "google"),
 }
 
+# Pricing used for models missing from the table
+_DEFAULT_PRICING = MODEL_PRICING["gpt-4.1"]
+
 # Models to show by provider
 MODELS_BY_PROVIDER = {
     "openai": ["gpt-4.1", "gpt-4.1-mini", "gpt-4.1-nano"],
@@ -53,67 +72,238 @@ MODELS_BY_PROVIDER = {
     "google": ["gemini-2.5-flash", "gemini-2.5-flash-lite"],
 }
 
+# (model, pricing) pairs per provider, resolved once for estimate_for_providers
+_PROVIDER_PLAN: dict[str, list[tuple[str, Pricing]]] = {
+    provider: [(m, MODEL_PRICING.get(m, _DEFAULT_PRICING)) for m in models]
+    for provider, models in MODELS_BY_PROVIDER.items()
+}
+
+
+# Max (content digest, encoding) entries kept by the shared count cache
+COUNT_CACHE_SIZE = 4096
+
+# Blank-line boundaries tiktoken never merges across: its pre-tokenizer always
+# splits after "\n\n" when non-whitespace follows ("/" excepted, since o200k's
+# punctuation rule can run "\n\n/" together)
+_PARAGRAPH_RE = re.compile(r"(?<=\n\n)(?=[^\s/])")
+
+# Token counts shared by every TokenCounter, so the combine preview and the
+# analytics/testing estimates never tokenize the same text twice
+_COUNT_CACHE: OrderedDict[tuple[bytes, str], int] = OrderedDict()
+_COUNT_CACHE_LOCK = threading.Lock()
+
+
+# Encoders shared by every TokenCounter
+_ENCODERS: dict[str, object] = {}
+_ENCODERS_LOCK = threading.Lock()
+_preload_started = False
+
+# Seconds to wait before retrying an encoding that failed to load
+ENCODER_RETRY_SECONDS = 60.0
+
+# Encoding name -> monotonic time of its last failed load
+_ENCODER_FAILURES: dict[str, float] = {}
+
+
+def _load_encoder(encoders: dict, encoding_name: str):
+    """Load an encoder into encoders once; waits if another thread is loading one.
+    
+    Returns None if the encoding failed to load within the last
+    ENCODER_RETRY_SECONDS, so a flaky download is retried later instead
+    of on every call.
+    """
+    with _ENCODERS_LOCK:
+        encoder = encoders.get(encoding_name)
+        if encoder is not None:
+            return encoder
+        failed_at = _ENCODER_FAILURES.get(encoding_name)
+        if failed_at is not None and time.monotonic() - failed_at < ENCODER_RETRY_SECONDS:
+            return None
+        try:
+            encoder = encoders[encoding_name] = tiktoken.get_encoding(encoding_name)
+        except Exception:
+            _ENCODER_FAILURES[encoding_name] = time.monotonic()
+            return None
+        _ENCODER_FAILURES.pop(encoding_name, None)
+        return encoder
+
+
+def _start_preload() -> None:
+    """Warm up every priced encoding on a background thread, once per process.
+    
+    Loading an encoding can take a second or more (and may download the
+    vocab), so this keeps the first count off the critical path.
+    """
+    global _preload_started
+    with _ENCODERS_LOCK:
+        if _preload_started:
+            return
+        _preload_started = True
+    
+    threading.Thread(
+        target=_preload,
+        args=({p.encoding for p in MODEL_PRICING.values()},),
+        name="tiktoken-preload",
+        daemon=True,
+    ).start()
+
+
+def _preload(encoding_names: set[str]) -> None:
+    for name in encoding_names:
+        _load_encoder(_ENCODERS, name)
+
 
 class TokenCounter:
     """Count tokens and estimate costs for prompts."""
 
     def __init__(self):
-        self._encoders = {}
+        self._encoders = _ENCODERS
+        self._count_cache = _COUNT_CACHE
+        self._encoding_by_model = {m: p.encoding for m, p in MODEL_PRICING.items()}
+        if TIKTOKEN_AVAILABLE:
+            _start_preload()
+
+    def cache_clear(self) -> None:
+        """Drop all cached token counts."""
+        with _COUNT_CACHE_LOCK:
+            self._count_cache.clear()
 
     def _get_encoder(self, encoding_name: str):
         """Get or create a tiktoken encoder."""
         if not TIKTOKEN_AVAILABLE:
             return None
         
-        if encoding_name not in self._encoders:
-            try:
-                self._encoders[encoding_name] = tiktoken.get_encoding(encoding_name)
-            except Exception:
-                return None
-        return self._encoders[encoding_name]
+        encoders = self._encoders
+        if encoding_name in encoders:
+            return encoders[encoding_name]
+        return _load_encoder(encoders, encoding_name)
+
+    def _get_model_encoder(self, model: str):
+        """Get the tiktoken encoder used for a model."""
+        return self._get_encoder(self._encoding_for(model))
+
+    def _encoding_for(self, model: str) -> str:
+        """Encoding name for a model, defaulting to gpt-4.1's."""
+        return self._encoding_by_model.get(model) or self._encoding_by_model["gpt-4.1"]
 
     def count_tokens(self, text: str, model: str = "gpt-4.1") -> int:
         """Count tokens for a given text and model."""
+        return self._count_for_encoding(text, self._encoding_for(model))
+
+    def _count_for_encoding(self, text: str, encoding: str) -> int:
+        """Count tokens with a named encoding, through the count cache."""
+        if not text:
+            return 0
         if not TIKTOKEN_AVAILABLE:
-            return len(text) // 4
+            return _approx_tokens(text)
+        
+        encoder = self._get_encoder(encoding)
         
-        pricing = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4.1"])
-        encoder = self._get_encoder(pricing["encoding"])
+        if not encoder:
+            return _approx_tokens(text)
+        
+        # Key on a short digest so the cache doesn't pin large prompts in memory.
+        # Models sharing an encoding share entries.
+        key = (hashlib.blake2b(text.encode(), digest_size=8).digest(), encoding)
+        cache = self._count_cache
+        with _COUNT_CACHE_LOCK:
+            count = cache.get(key)
+            if count is not None:
+                cache.move_to_end(key)
+                return count
+        
+        # Encode outside the lock; a concurrent miss just stores the same count
+        count = len(encoder.encode(text))
+        with _COUNT_CACHE_LOCK:
+            cache[key] = count
+            if len(cache) > COUNT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return count
+
+    def count_tokens_incremental(self, text: str, model: str = "gpt-4.1") -> int:
+        """Count tokens paragraph by paragraph through the count cache.
         
-        if encoder:
-            return len(encoder.encode(text))
-        return len(text) // 4
+        Re-counting a prompt that grew or was edited only tokenizes the
+        paragraphs that changed (an append also touches the old last
+        paragraph), and the sum equals the full-text count.
+        """
+        encoding = self._encoding_for(model)
+        if not self._get_encoder(encoding):
+            return _approx_tokens(text)
+        count = self._count_for_encoding
+        return sum(count(part, encoding) for part in _PARAGRAPH_RE.split(text))
+
+    def count_tokens_batch(self, texts: list[str], model: str = "gpt-4.1") -> list[int]:
+        """Count tokens for many short texts with one encoder lookup and no caching."""
+        encoder = self._get_model_encoder(model)
+        if not encoder:
+            return [_approx_tokens(text) for text in texts]
+        encode = encoder.encode
+        return [len(encode(text)) for text in texts]
+
+    def encode(self, text: str, model: str = "gpt-4.1") -> Optional[list[int]]:
+        """Encode text to token ids. Returns None if no tokenizer is available."""
+        encoder = self._get_model_encoder(model)
+        return encoder.encode(text) if encoder else None
+
+    def decode(self, tokens: list[int], model: str = "gpt-4.1") -> Optional[str]:
+        """Decode token ids produced by encode(). Returns None if no tokenizer is available."""
+        encoder = self._get_model_encoder(model)
+        return encoder.decode(tokens) if encoder else None
 
     def estimate_cost(self, text: str, model: str = "gpt-4.1") -> TokenEstimate:
         """Estimate the cost for a prompt."""
-        token_count = self.count_tokens(text, model)
-        pricing = MODEL_PRICING.get(model, MODEL_PRICING["gpt-4.1"])
-        
-        input_cost = (token_count / 1000) * pricing["input"]
-        
-        return TokenEstimate(
-            token_count=token_count,
-            model=model,
-            provider=pricing.get("provider", "unknown"),
-            input_cost=input_cost,
-            output_cost_1k=pricing["output"]
-        )
+        return self._estimate(model, self.count_tokens(text, model))
 
-    def estimate_for_providers(self, text: str, available_providers: list[str]) -> list[TokenEstimate]:
-        """Estimate costs for models from available providers only."""
+    def _estimate(self, model: str, token_count: int) -> TokenEstimate:
+        """Price an already-counted prompt for a model."""
+        return _price(model, MODEL_PRICING.get(model, _DEFAULT_PRICING), token_count)
+
+    def _estimate_plan(self, text: str, plan) -> list[TokenEstimate]:
+        """Price text for (model, pricing) pairs, tokenizing once per distinct encoding."""
+        counts = {}
         estimates = []
-        for provider in available_providers:
-            models = MODELS_BY_PROVIDER.get(provider, [])
-            for model in models:
-                estimates.append(self.estimate_cost(text, model))
+        for model, pricing in plan:
+            count = counts.get(pricing.encoding)
+            if count is None:
+                count = counts[pricing.encoding] = self._count_for_encoding(text, pricing.encoding)
+            estimates.append(_price(model, pricing, count))
         return estimates
 
+    def estimate_for_providers(self, text: str, available_providers: list[str]) -> list[TokenEstimate]:
+        """Estimate costs for models from available providers only."""
+        return self._estimate_plan(
+            text,
+            (entry for provider in available_providers for entry in _PROVIDER_PLAN.get(provider, ())),
+        )
+
     def estimate_all_models(self, text: str, models: list[str] = None) -> list[TokenEstimate]:
         """Estimate costs across multiple models."""
         if models is None:
             # Default to a representative set
             models = ["gpt-4.1-mini", "claude-sonnet-4-5-20250929", "gemini-2.5-flash"]
-        return [self.estimate_cost(text, model) for model in models if model in MODEL_PRICING]
+        return self._estimate_plan(text, [(m, MODEL_PRICING[m]) for m in models if m in MODEL_PRICING])
+
+
+def _approx_tokens(text: str) -> int:
+    """Rough token count when no tokenizer is available: about four UTF-8 bytes per token."""
+    return max(1, len(text.encode("utf-8")) // 4) if text else 0
+
+
+def _price(model: str, pricing: Pricing, token_count: int) -> TokenEstimate:
+    return TokenEstimate(
+        token_count=token_count,
+        model=model,
+        provider=pricing.provider,
+        input_cost=token_count * pricing.input_microcents / MICROCENTS_PER_DOLLAR,
+        output_cost_1k=pricing.output_microcents * 1000 / MICROCENTS_PER_DOLLAR
+    )
+
+
+@lru_cache(maxsize=1)
+def get_token_counter() -> TokenCounter:
+    """Shared TokenCounter, so its count cache serves every caller."""
+    return TokenCounter()
 
 
 def is_tiktoken_available() -> bool:
@@ -6,6 +6,7 @@ It lives in workbench to prevent modification by feature developers.
 Requirements: 1.1, 1.2, 1.3, 1.5, 9.1
 """
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Awaitable, Any, Optional, Union
@@ -25,7 +26,7 @@ class FeatureCategory(Enum):
     SYSTEM = "system"       # Settings, quit - always shown last
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeatureManifest:
     """Metadata describing a contrib feature.
     
@@ -62,6 +63,14 @@ class FeatureManifest:
     menu_key: Optional[str] = None
     menu_order: int = 50                # Lower numbers appear first (0-100)
 
+    def __post_init__(self) -> None:
+        # Names key the registry and colors repeat across features; share one object each.
+        # Non-strings are left for discovery to report as validation errors.
+        for attr in ("name", "color"):
+            value = getattr(self, attr)
+            if type(value) is str:
+                object.__setattr__(self, attr, sys.intern(value))
+
 
 @dataclass
 class FeatureContext:
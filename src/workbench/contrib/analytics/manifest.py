@@ -4,6 +4,12 @@ Analytics feature manifest - prompt usage analytics dashboard.
 Requirements: 2.1, 2.2, 2.3
 """
 
+from pathlib import Path
+
+from rich import box
+from rich.prompt import Prompt
+from rich.table import Table
+
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -23,11 +29,13 @@ MANIFEST = FeatureManifest(
     menu_order=60,
 )
 
+# Exports land in the directory the app was launched from
+_EXPORT_DIR = Path.cwd()
+
 
 def run(ctx: FeatureContext) -> FeatureResult:
     """Run the analytics feature - display usage statistics."""
     # Import dependencies inside function to avoid module-level import issues
-    from rich.prompt import Prompt
     from .service import PromptAnalytics
     
     analytics = PromptAnalytics()
@@ -42,25 +50,15 @@ def run(ctx: FeatureContext) -> FeatureResult:
         
         choice = Prompt.ask("Select option", choices=["1", "2", "3", "4", "5"], default="1")
         
-        if choice == "1":
-            _show_summary(ctx, analytics)
-        elif choice == "2":
-            _show_cost_breakdown(ctx, analytics)
-        elif choice == "3":
-            _show_recent_usage(ctx, analytics)
-        elif choice == "4":
-            _export_data(ctx, analytics)
-        elif choice == "5":
+        if choice == "5":
             break
+        _ACTIONS[choice](ctx, analytics)
     
     return FeatureResult(success=True, message="Analytics session complete")
 
 
 def _show_summary(ctx: FeatureContext, analytics) -> None:
     """Display analytics summary."""
-    from rich.table import Table
-    from rich import box
-    
     summary = analytics.get_summary(days=30)
     
     ctx.console.print("\n[bold]📈 30-Day Summary[/]")
@@ -93,9 +91,6 @@ def _show_summary(ctx: FeatureContext, analytics) -> None:
 
 def _show_cost_breakdown(ctx: FeatureContext, analytics) -> None:
     """Display cost breakdown."""
-    from rich.table import Table
-    from rich import box
-    
     breakdown = analytics.get_cost_breakdown(days=30)
     
     ctx.console.print("\n[bold]💰 Cost Breakdown (30 days)[/]")
@@ -129,12 +124,9 @@ def _show_cost_breakdown(ctx: FeatureContext, analytics) -> None:
 
 def _show_recent_usage(ctx: FeatureContext, analytics) -> None:
     """Display recent usage records."""
-    from rich.table import Table
-    from rich import box
-    
-    records = analytics.get_recent_usage(limit=10)
+    rows = analytics.get_recent_usage_rows(limit=10)
     
-    if not records:
+    if not rows:
         ctx.console.print("[dim]No usage records yet.[/]")
         return
     
@@ -148,39 +140,23 @@ def _show_recent_usage(ctx: FeatureContext, analytics) -> None:
     table.add_column("Cost", justify="right")
     table.add_column("Status", justify="center")
     
-    for record in records:
-        timestamp = record.timestamp[:16] if record.timestamp else ""
-        tokens = record.input_tokens + record.output_tokens
-        status = "[green]✓[/]" if record.success else "[red]✗[/]"
-        
-        table.add_row(
-            timestamp,
-            record.technique,
-            record.model or "-",
-            str(tokens),
-            f"${record.cost:.4f}",
-            status
-        )
+    for *columns, success in rows:
+        table.add_row(*columns, _STATUS[success])
     
     ctx.console.print(table)
 
 
 def _export_data(ctx: FeatureContext, analytics) -> None:
     """Export analytics data."""
-    from rich.prompt import Prompt
-    
     days = Prompt.ask("Export data for how many days?", default="30")
     
     try:
         days_int = int(days)
-        data = analytics.export_data(days=days_int)
+        data = analytics.export_data_bytes(days=days_int)
         
         # Save to file
-        from pathlib import Path
-        export_path = Path.cwd() / f"analytics_export_{days_int}d.json"
-        
-        with open(export_path, 'w') as f:
-            f.write(data)
+        export_path = _EXPORT_DIR / f"analytics_export_{days_int}d.json"
+        export_path.write_bytes(data)
         
         ctx.console.print(f"[green]✓ Exported to {export_path}[/]")
         
@@ -188,3 +164,15 @@ def _export_data(ctx: FeatureContext, analytics) -> None:
         ctx.console.print("[red]Invalid number of days[/]")
     except Exception as e:
         ctx.console.print(f"[red]Export failed: {e}[/]")
+
+
+# Status cell markup for recent usage rows
+_STATUS = {True: "[green]✓[/]", False: "[red]✗[/]"}
+
+# Dashboard menu choices
+_ACTIONS = {
+    "1": _show_summary,
+    "2": _show_cost_breakdown,
+    "3": _show_recent_usage,
+    "4": _export_data,
+}
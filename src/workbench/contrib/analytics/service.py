@@ -9,6 +9,12 @@ from datetime import datetime, timedelta
 from typing import Optional
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.platform.environment import get_config_dir
 
 
@@ -234,8 +240,23 @@ class PromptAnalytics:
             for row in rows
         ]
 
-    def export_data(self, days: int = None) -> str:
-        """Export analytics data as JSON."""
+    def get_recent_usage_rows(self, limit: int = 20) -> list[tuple[str, str, str, str, str, bool]]:
+        """Get recent usage as display columns: time, technique, model, tokens, cost, success."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("""
+                SELECT COALESCE(substr(timestamp, 1, 16), ''), technique,
+                       COALESCE(NULLIF(model, ''), '-'), input_tokens + output_tokens,
+                       cost, success
+                FROM usage ORDER BY timestamp DESC LIMIT ?
+            """, (limit,)).fetchall()
+        
+        return [
+            (timestamp, technique, model, str(tokens), f"${cost:.4f}", bool(success))
+            for timestamp, technique, model, tokens, cost, success in rows
+        ]
+
+    def export_data_raw(self, days: int = None) -> list[dict]:
+        """Export analytics rows as dicts."""
         query = "SELECT * FROM usage"
         params = ()
         
@@ -248,8 +269,18 @@ class PromptAnalytics:
             conn.row_factory = sqlite3.Row
             rows = conn.execute(query, params).fetchall()
         
-        data = [dict(row) for row in rows]
-        return json.dumps(data, indent=2)
+        return [dict(row) for row in rows]
+
+    def export_data(self, days: int = None) -> str:
+        """Export analytics data as JSON."""
+        return json.dumps(self.export_data_raw(days), indent=2)
+
+    def export_data_bytes(self, days: int = None) -> bytes:
+        """Export analytics data as UTF-8 JSON, encoded with orjson when installed."""
+        data = self.export_data_raw(days)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode()
 
     def clear_old_data(self, days: int = 90) -> int:
         """Clear data older than specified days."""
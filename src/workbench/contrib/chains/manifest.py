@@ -4,6 +4,14 @@ Chains feature manifest - multi-step prompt chain execution.
 Requirements: 2.1, 2.2, 2.3
 """
 
+import re
+from functools import lru_cache
+
+from rich import box
+from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.table import Table
+
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -24,19 +32,22 @@ MANIFEST = FeatureManifest(
 )
 
 
+# Pattern for {variable} placeholders in step templates
+_VAR_RE = re.compile(r'\{(\w+)\}')
+
+
+@lru_cache(maxsize=128)
+def _extract_vars(template: str) -> tuple[str, ...]:
+    """Placeholder names in a step template, in order of appearance."""
+    return tuple(_VAR_RE.findall(template))
+
+
 async def run(ctx: FeatureContext) -> FeatureResult:
     """Run the chains feature - execute multi-step prompt workflows."""
     # Import dependencies inside function to avoid module-level import issues
-    from rich.prompt import Prompt
     from .service import ChainService
     from .builtin import BUILTIN_CHAINS
     
-    if not ctx.llm_client:
-        return FeatureResult(
-            success=False,
-            error="LLM client not available. Please configure an API key."
-        )
-    
     chain_service = ChainService(ctx.llm_client)
     
     while True:
@@ -48,21 +59,15 @@ async def run(ctx: FeatureContext) -> FeatureResult:
         
         choice = Prompt.ask("Select option", choices=["1", "2", "3", "4"], default="1")
         
-        if choice == "1":
-            await _run_builtin_chain(ctx, chain_service)
-        elif choice == "2":
-            await _run_saved_chain(ctx, chain_service)
-        elif choice == "3":
-            _list_chains(ctx, chain_service)
-        elif choice == "4":
+        if choice == "4":
             break
+        await _ACTIONS[choice](ctx, chain_service)
     
     return FeatureResult(success=True, message="Chains session complete")
 
 
 async def _run_builtin_chain(ctx: FeatureContext, service) -> None:
     """Run a built-in chain template."""
-    from rich.prompt import Prompt
     from .builtin import BUILTIN_CHAINS
     
     ctx.console.print("\n[bold]Built-in Chains:[/]")
@@ -84,8 +89,6 @@ async def _run_builtin_chain(ctx: FeatureContext, service) -> None:
 
 async def _run_saved_chain(ctx: FeatureContext, service) -> None:
     """Run a saved chain."""
-    from rich.prompt import Prompt
-    
     chains = service.list_chains()
     
     if not chains:
@@ -108,9 +111,6 @@ async def _run_saved_chain(ctx: FeatureContext, service) -> None:
 
 async def _execute_chain(ctx: FeatureContext, service, chain) -> None:
     """Execute a chain and display results."""
-    from rich.prompt import Prompt
-    from rich.panel import Panel
-    
     ctx.console.print(f"\n[bold]Running chain: {chain.name}[/]")
     ctx.console.print(f"[dim]Steps: {len(chain.steps)}[/]\n")
     
@@ -120,8 +120,7 @@ async def _execute_chain(ctx: FeatureContext, service, chain) -> None:
     # Find variables in the first step
     first_step = chain.steps[0] if chain.steps else None
     if first_step:
-        import re
-        vars_found = re.findall(r'\{(\w+)\}', first_step.prompt_template)
+        vars_found = _extract_vars(first_step.prompt_template)
         for var in vars_found:
             if var not in chain.initial_context:
                 value = Prompt.ask(f"Enter value for '{var}'")
@@ -151,11 +150,8 @@ async def _execute_chain(ctx: FeatureContext, service, chain) -> None:
         ctx.console.print(Panel(result.final_output, border_style="green"))
 
 
-def _list_chains(ctx: FeatureContext, service) -> None:
+async def _list_chains(ctx: FeatureContext, service) -> None:
     """List all saved chains."""
-    from rich.table import Table
-    from rich import box
-    
     chains = service.list_chains()
     
     if not chains:
@@ -171,3 +167,11 @@ def _list_chains(ctx: FeatureContext, service) -> None:
         table.add_row(chain.name, chain.description, str(len(chain.steps)))
     
     ctx.console.print(table)
+
+
+# Chains menu choices
+_ACTIONS = {
+    "1": _run_builtin_chain,
+    "2": _run_saved_chain,
+    "3": _list_chains,
+}
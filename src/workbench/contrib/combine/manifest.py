@@ -1,5 +1,10 @@
 """Manifest for the Combine feature."""
 
+from functools import lru_cache
+
+from rich import box
+from rich.panel import Panel
+
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -19,10 +24,14 @@ MANIFEST = FeatureManifest(
 )
 
 
+@lru_cache(maxsize=64)
+def _combined_technique_key(prompt_types: tuple) -> str:
+    """History technique key for a combination of prompt types."""
+    return "combined:" + "+".join(p.value for p in prompt_types)
+
+
 def run(ctx: FeatureContext) -> FeatureResult:
     """Combine multiple techniques into a mega-prompt."""
-    from rich.panel import Panel
-    from rich import box
     from .ui import (
         show_technique_table, gather_technique_selection,
         gather_task_context, build_combined_prompt,
@@ -57,9 +66,8 @@ def run(ctx: FeatureContext) -> FeatureResult:
     
     # Save to history
     tags = ask_tags(ctx.console)
-    technique_names = "+".join([p.value for p, _, _ in selected])
     prompt_id = ctx.history.save(
-        technique=f"combined:{technique_names}",
+        technique=_combined_technique_key(tuple(p for p, _, _ in selected)),
         task=task,
         prompt=result,
         tags=tags
@@ -1,14 +1,40 @@
 """UI components for the combine feature."""
 
+import io
+from functools import lru_cache
+
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt
+from rich.text import Text
 from rich import box
 
 from src.core import PromptType, PromptConfig
-from src.platform.clipboard import copy_to_clipboard, is_clipboard_available
 from src.workbench.contrib.new_prompt.common import TECHNIQUES
+from src.workbench.contrib.new_prompt.ui import prompt_actions  # shared post-save actions
+
+
+# Fixed pieces of the combined prompt, pre-joined so each is a single write
+_BAR = "=" * 50 + "\n"
+_SEP = "\n\n" + "-" * 50
+_HEADER = _BAR + "COMBINED PROMPT - Multiple Techniques\n" + _BAR
+_FOOTER = _SEP + "\n\nSynthesize insights from all approaches above to provide a comprehensive answer."
+
+# Prompt labels parsed once instead of on every ask
+_ASK_TECHNIQUES = Text.from_markup("[bold]Techniques to combine[/] [dim](e.g., 3 1 4)[/]", style="prompt")
+_ASK_TASK = Text.from_markup("[bold cyan]📝 What is your task/question?[/]", style="prompt")
+_ASK_CONTEXT = Text.from_markup("[bold blue]📖 Context[/] [dim](optional)[/]", style="prompt")
+_ASK_TAGS = Text.from_markup("\n[bold]🏷️  Tags[/] [dim](comma-separated, Enter to skip)[/]", style="prompt")
+
+
+@lru_cache(maxsize=256)
+def _render_section(builder, ptype: PromptType, task: str, context: str) -> str:
+    """Render one technique's section, reused when the same combination is rebuilt.
+    
+    PromptBuilder hashes by identity, so entries never leak between builders.
+    """
+    return builder.build(ptype, PromptConfig(task=task, context=context))
 
 
 def show_technique_table(console: Console) -> None:
@@ -18,18 +44,8 @@ def show_technique_table(console: Console) -> None:
     table.add_column("Technique", width=22)
     table.add_column("Adds", style="dim")
     
-    combo_info = [
-        "Step-by-step reasoning",
-        "Learning examples",
-        "Expert persona context",
-        "Output format requirements",
-        "Reasoning + action framework",
-        "Multi-path exploration",
-        "Verification approach",
-    ]
-    
-    for i, (ptype, name, icon, color, _) in enumerate(TECHNIQUES, 1):
-        table.add_row(f"[{color}]{i}[/]", f"{icon} [{color}]{name}[/]", combo_info[i-1])
+    for i, (ptype, name, icon, color, desc) in enumerate(TECHNIQUES, 1):
+        table.add_row(f"[{color}]{i}[/]", f"{icon} [{color}]{name}[/]", desc)
     
     console.print(table)
 
@@ -37,7 +53,7 @@ def show_technique_table(console: Console) -> None:
 def gather_technique_selection(console: Console) -> list[tuple]:
     """Get user's technique selections."""
     console.print()
-    choices = Prompt.ask("[bold]Techniques to combine[/] [dim](e.g., 3 1 4)[/]", default="3 1")
+    choices = Prompt.ask(_ASK_TECHNIQUES, default="3 1")
     
     try:
         indices = [int(x) - 1 for x in choices.split()]
@@ -53,34 +69,31 @@ def gather_task_context(console: Console, selected: list[tuple]) -> tuple[str, s
     selected_names = " + ".join([f"[{c}]{n}[/]" for _, n, c in selected])
     console.print(f"\n[bold]Combining:[/] {selected_names}\n")
     
-    task = Prompt.ask("[bold cyan]📝 What is your task/question?[/]")
-    context = Prompt.ask("[bold blue]📖 Context[/] [dim](optional)[/]", default="")
+    task = Prompt.ask(_ASK_TASK)
+    context = Prompt.ask(_ASK_CONTEXT, default="")
     
     return task, context
 
 
 def build_combined_prompt(builder, selected: list[tuple], task: str, context: str) -> str:
     """Build the combined prompt from multiple techniques."""
-    combined_parts = []
-    combined_parts.append("=" * 50)
-    combined_parts.append("COMBINED PROMPT - Multiple Techniques")
-    combined_parts.append("=" * 50)
+    buf = io.StringIO()
+    w = buf.write
+    w(_HEADER)
     
     if context:
-        combined_parts.append(f"\nContext: {context}")
-    combined_parts.append(f"\nTask: {task}")
-    combined_parts.append("\n" + "-" * 50)
+        w(f"\nContext: {context}\n")
+    w(f"\nTask: {task}")
     
+    # Each separator is written together with the heading that follows it;
+    # sections are written as-is so large renders aren't copied again
     for ptype, name, _ in selected:
-        config = PromptConfig(task=task, context=context)
-        section = builder.build(ptype, config)
-        combined_parts.append(f"\n## {name.upper()} APPROACH ##\n")
-        combined_parts.append(section)
-        combined_parts.append("\n" + "-" * 50)
+        w(f"{_SEP}\n\n## {name.upper()} APPROACH ##\n\n")
+        w(_render_section(builder, ptype, task, context))
     
-    combined_parts.append("\nSynthesize insights from all approaches above to provide a comprehensive answer.")
+    w(_FOOTER)
     
-    return "\n".join(combined_parts)
+    return buf.getvalue()
 
 
 def display_result(console: Console, prompt: str, token_counter) -> None:
@@ -100,28 +113,8 @@ def display_result(console: Console, prompt: str, token_counter) -> None:
 
 def ask_tags(console: Console) -> list[str]:
     """Ask for optional tags."""
-    tags_input = Prompt.ask("\n[bold]🏷️  Tags[/] [dim](comma-separated, Enter to skip)[/]", default="")
+    tags_input = Prompt.ask(_ASK_TAGS, default="")
     if tags_input:
         return [t.strip() for t in tags_input.split(",") if t.strip()]
     return []
 
-
-def prompt_actions(console: Console, prompt_id: int, prompt: str, history) -> None:
-    """Offer actions after prompt creation."""
-    if is_clipboard_available():
-        if copy_to_clipboard(prompt):
-            console.print("[green]📋 Copied to clipboard![/]")
-    
-    while True:
-        console.print("\n[bold]Actions:[/] [cyan]c[/]=copy [yellow]f[/]=favorite [dim]Enter[/]=continue")
-        action = Prompt.ask("[bold]Action[/]", default="")
-        
-        if action == "c":
-            if copy_to_clipboard(prompt):
-                console.print("[green]📋 Copied to clipboard![/]")
-        elif action == "f":
-            is_fav = history.toggle_favorite(prompt_id)
-            status = "[yellow]⭐ Added to favorites[/]" if is_fav else "[dim]Removed from favorites[/]"
-            console.print(status)
-        else:
-            break
@@ -4,11 +4,30 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
+from rich.text import Text
 from rich import box
 
 from src.platform.clipboard import copy_to_clipboard
 
 
+# Tasks longer than this are cut to fit the Task column, ellipsis included
+TASK_PREVIEW_WIDTH = 35
+_TASK_CUT = TASK_PREVIEW_WIDTH - 3
+
+# Parsed once; view_prompt reprints it every loop
+_ACTIONS_HINT = Text.from_markup("\n[bold]Actions:[/] [cyan]c[/]=copy [yellow]f[/]=toggle favorite [red]d[/]=delete [dim]b[/]=back")
+
+# Prompt labels parsed once instead of on every ask
+_ASK_SELECT = Text.from_markup("\n[bold]Select #[/] [dim](or Enter to go back)[/]", style="prompt")
+_ASK_ACTION = Text.from_markup("[bold]Action[/]", style="prompt")
+_ASK_DELETE = Text.from_markup("[red]Delete this prompt?[/]", style="prompt")
+
+_COPIED = Text.from_markup("[green]📋 Copied to clipboard![/]")
+_FAV_TOGGLED = Text.from_markup("[yellow]⭐ Favorite toggled[/]")
+_FAV_REMOVED = Text.from_markup("[dim]Removed from favorites[/]")
+_DELETED = Text.from_markup("[red]🗑️  Deleted[/]")
+
+
 def display_prompt_list(console: Console, prompts: list, title: str) -> None:
     """Display a list of prompts."""
     table = Table(title=title, box=box.ROUNDED, border_style="dim")
@@ -18,18 +37,26 @@ def display_prompt_list(console: Console, prompts: list, title: str) -> None:
     table.add_column("Tags", style="dim", width=15)
     table.add_column("⭐", width=3)
     
-    for i, p in enumerate(prompts, 1):
-        fav = "⭐" if p.is_favorite else ""
-        task_preview = p.task[:32] + "..." if len(p.task) > 35 else p.task
-        tags = ", ".join(p.tags[:3]) if p.tags else ""
-        table.add_row(str(i), p.technique, task_preview, tags, fav)
+    rows = [
+        (
+            str(i),
+            p.technique,
+            p.task if len(p.task) <= TASK_PREVIEW_WIDTH else p.task[:_TASK_CUT] + "...",
+            p.tag_display,
+            "⭐" if p.is_favorite else "",
+        )
+        for i, p in enumerate(prompts, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
     
-    console.print(table)
+    # Columns carry their own styles; skip the repr highlighter pass over every cell
+    console.print(table, highlight=False)
 
 
 def select_from_list(console: Console, prompts: list):
     """Let user select a prompt from the list."""
-    choice = Prompt.ask("\n[bold]Select #[/] [dim](or Enter to go back)[/]", default="")
+    choice = Prompt.ask(_ASK_SELECT, default="")
     
     if not choice:
         return None
@@ -56,19 +83,39 @@ def view_prompt(console: Console, saved, history) -> None:
     ))
     
     while True:
-        console.print("\n[bold]Actions:[/] [cyan]c[/]=copy [yellow]f[/]=toggle favorite [red]d[/]=delete [dim]b[/]=back")
-        action = Prompt.ask("[bold]Action[/]", default="b")
-        
-        if action == "c":
-            if copy_to_clipboard(saved.prompt):
-                console.print("[green]📋 Copied to clipboard![/]")
-        elif action == "f":
-            is_fav = history.toggle_favorite(saved.id)
-            console.print("[yellow]⭐ Favorite toggled[/]" if is_fav else "[dim]Removed from favorites[/]")
-        elif action == "d":
-            if Confirm.ask("[red]Delete this prompt?[/]", default=False):
-                history.delete(saved.id)
-                console.print("[red]🗑️  Deleted[/]")
-                break
-        elif action == "b":
+        console.print(_ACTIONS_HINT)
+        handler = _VIEW_ACTIONS.get(Prompt.ask(_ASK_ACTION, default="b"))
+        # Handlers return True when the view should close; unknown input re-asks
+        if handler is not None and handler(console, saved, history):
             break
+
+
+def _copy_saved(console: Console, saved, history) -> bool:
+    if copy_to_clipboard(saved.prompt):
+        console.print(_COPIED)
+    return False
+
+
+def _toggle_saved(console: Console, saved, history) -> bool:
+    console.print(_FAV_TOGGLED if history.toggle_favorite(saved.id) else _FAV_REMOVED)
+    return False
+
+
+def _delete_saved(console: Console, saved, history) -> bool:
+    if not Confirm.ask(_ASK_DELETE, default=False):
+        return False
+    history.delete(saved.id)
+    console.print(_DELETED)
+    return True
+
+
+def _back(console: Console, saved, history) -> bool:
+    return True
+
+
+_VIEW_ACTIONS = {
+    "c": _copy_saved,
+    "f": _toggle_saved,
+    "d": _delete_saved,
+    "b": _back,
+}
@@ -3,6 +3,7 @@ History feature - common types.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
 
@@ -16,6 +17,11 @@ class SavedPrompt:
     is_favorite: bool
     created_at: datetime
 
+    @cached_property
+    def tag_display(self) -> str:
+        """First three tags for list views, joined once per object."""
+        return ", ".join(self.tags[:3]) if self.tags else ""
+
     @classmethod
     def from_row(cls, row: tuple) -> "SavedPrompt":
         return cls(
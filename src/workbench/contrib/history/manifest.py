@@ -4,6 +4,11 @@ History feature manifest - manages prompt history and favorites.
 Requirements: 2.1, 2.2, 2.3
 """
 
+from rich import box
+from rich.prompt import Prompt
+from rich.table import Table
+from rich.text import Text
+
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -23,23 +28,24 @@ MANIFEST = FeatureManifest(
     menu_order=30,
 )
 
+_MENU = (
+    "\n[bold blue]📜 Prompt History[/]\n"
+    "1. View recent prompts\n"
+    "2. View favorites\n"
+    "3. Search prompts\n"
+    "4. Back to menu"
+)
+
 
 def run(ctx: FeatureContext) -> FeatureResult:
     """Run the history feature - display and manage prompt history."""
     # Import dependencies inside function to avoid module-level import issues
-    from rich.prompt import Prompt
-    from rich.table import Table
-    from rich import box
     from .service import HistoryService
     
     history = HistoryService()
     
     while True:
-        ctx.console.print("\n[bold blue]📜 Prompt History[/]")
-        ctx.console.print("1. View recent prompts")
-        ctx.console.print("2. View favorites")
-        ctx.console.print("3. Search prompts")
-        ctx.console.print("4. Back to menu")
+        ctx.console.print(_MENU)
         
         choice = Prompt.ask("Select option", choices=["1", "2", "3", "4"], default="1")
         
@@ -77,9 +83,6 @@ def run(ctx: FeatureContext) -> FeatureResult:
 
 def _display_prompts(ctx: FeatureContext, prompts: list, title: str) -> None:
     """Display a table of prompts."""
-    from rich.table import Table
-    from rich import box
-    
     table = Table(title=title, box=box.ROUNDED, border_style="blue")
     table.add_column("#", style="dim", width=4)
     table.add_column("Technique", style="cyan", width=15)
@@ -87,18 +90,25 @@ def _display_prompts(ctx: FeatureContext, prompts: list, title: str) -> None:
     table.add_column("⭐", width=3)
     table.add_column("Date", style="dim", width=12)
     
-    for i, p in enumerate(prompts, 1):
-        star = "⭐" if p.is_favorite else ""
-        date = p.created_at.strftime("%Y-%m-%d") if p.created_at else ""
-        table.add_row(str(i), p.technique, p.task[:30], star, date)
+    rows = [
+        (
+            str(i),
+            p.technique,
+            p.task[:30],
+            "⭐" if p.is_favorite else "",
+            p.created_at.strftime("%Y-%m-%d") if p.created_at else "",
+        )
+        for i, p in enumerate(prompts, 1)
+    ]
+    for row in rows:
+        table.add_row(*row)
     
-    ctx.console.print(table)
+    # Columns carry their own styles; skip the repr highlighter pass over every cell
+    ctx.console.print(table, highlight=False)
 
 
 def _handle_prompt_action(ctx: FeatureContext, history, prompts: list) -> None:
     """Handle actions on displayed prompts."""
-    from rich.prompt import Prompt
-    
     if not prompts:
         return
         
@@ -108,28 +118,43 @@ def _handle_prompt_action(ctx: FeatureContext, history, prompts: list) -> None:
     if not action:
         return
         
+    # 'f#' and 'd#' pick a handler by prefix; a bare number views the prompt
+    handler = _PROMPT_ACTIONS.get(action[0])
+    number = action if handler is None else action[1:]
+    
     try:
-        if action.startswith('f'):
-            idx = int(action[1:]) - 1
-            if 0 <= idx < len(prompts):
-                new_status = history.toggle_favorite(prompts[idx].id)
-                status_text = "added to" if new_status else "removed from"
-                ctx.console.print(f"[green]Prompt {status_text} favorites[/]")
-                
-        elif action.startswith('d'):
-            idx = int(action[1:]) - 1
-            if 0 <= idx < len(prompts):
-                if history.delete(prompts[idx].id):
-                    ctx.console.print("[red]Prompt deleted[/]")
-                    
-        else:
-            idx = int(action) - 1
-            if 0 <= idx < len(prompts):
-                prompt = prompts[idx]
-                ctx.console.print(f"\n[bold]Technique:[/] {prompt.technique}")
-                ctx.console.print(f"[bold]Task:[/] {prompt.task}")
-                ctx.console.print(f"\n[bold]Prompt:[/]\n{prompt.prompt}")
-                if prompt.tags:
-                    ctx.console.print(f"\n[bold]Tags:[/] {', '.join(prompt.tags)}")
+        idx = int(number) - 1
+        if 0 <= idx < len(prompts):
+            (handler or _view_prompt)(ctx, history, prompts[idx])
     except (ValueError, IndexError):
         ctx.console.print("[red]Invalid selection[/]")
+
+
+def _toggle_favorite(ctx: FeatureContext, history, prompt) -> None:
+    new_status = history.toggle_favorite(prompt.id)
+    status_text = "added to" if new_status else "removed from"
+    ctx.console.print(f"[green]Prompt {status_text} favorites[/]")
+
+
+def _delete_prompt(ctx: FeatureContext, history, prompt) -> None:
+    if history.delete(prompt.id):
+        ctx.console.print("[red]Prompt deleted[/]")
+
+
+def _view_prompt(ctx: FeatureContext, history, prompt) -> None:
+    # One print for the whole view; stored text is shown verbatim, not as markup
+    body = Text.assemble(
+        ("\nTechnique:", "bold"), f" {prompt.technique}\n",
+        ("Task:", "bold"), f" {prompt.task}\n",
+        ("\nPrompt:", "bold"), f"\n{prompt.prompt}",
+    )
+    if prompt.tags:
+        body.append("\n\nTags:", style="bold")
+        body.append(f" {', '.join(prompt.tags)}")
+    ctx.console.print(body)
+
+
+_PROMPT_ACTIONS = {
+    "f": _toggle_favorite,
+    "d": _delete_prompt,
+}
@@ -32,6 +32,43 @@ class HistoryService(BaseStorage):
             conn.execute("CREATE INDEX IF NOT EXISTS idx_technique ON prompts(technique)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_favorite ON prompts(is_favorite)")
             conn.commit()
+            self._fts = self._init_search_index(conn)
+
+    def _init_search_index(self, conn: sqlite3.Connection) -> bool:
+        """Keep a trigram full-text index of task and tags in step with prompts.
+
+        Returns False when this SQLite build lacks FTS5 trigram support, in
+        which case search falls back to a LIKE scan.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'prompts_fts'"
+        ).fetchone()
+        if exists:
+            return True
+        try:
+            conn.executescript("""
+                CREATE VIRTUAL TABLE prompts_fts USING fts5(
+                    task, tags, content='prompts', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER prompts_fts_insert AFTER INSERT ON prompts BEGIN
+                    INSERT INTO prompts_fts(rowid, task, tags) VALUES (new.id, new.task, new.tags);
+                END;
+                CREATE TRIGGER prompts_fts_delete AFTER DELETE ON prompts BEGIN
+                    INSERT INTO prompts_fts(prompts_fts, rowid, task, tags)
+                    VALUES ('delete', old.id, old.task, old.tags);
+                END;
+                CREATE TRIGGER prompts_fts_update AFTER UPDATE OF task, tags ON prompts BEGIN
+                    INSERT INTO prompts_fts(prompts_fts, rowid, task, tags)
+                    VALUES ('delete', old.id, old.task, old.tags);
+                    INSERT INTO prompts_fts(rowid, task, tags) VALUES (new.id, new.task, new.tags);
+                END;
+                INSERT INTO prompts_fts(prompts_fts) VALUES ('rebuild');
+            """)
+            conn.commit()
+        except sqlite3.OperationalError:
+            conn.rollback()
+            return False
+        return True
 
     def save(self, technique: str, task: str, prompt: str, tags: list[str] = None) -> int:
         """Save a prompt and return its ID."""
@@ -61,7 +98,16 @@ class HistoryService(BaseStorage):
         return [SavedPrompt.from_row(r) for r in rows]
 
     def search(self, query: str) -> list[SavedPrompt]:
-        """Search prompts by task or tags."""
+        """Search prompts by task or tags (case-insensitive substring match)."""
+        # Trigrams need at least three characters to hit the index
+        if self._fts and len(query) >= 3:
+            phrase = '{task tags} : "' + query.replace('"', '""') + '"'
+            rows = self.execute(
+                "SELECT prompts.* FROM prompts_fts JOIN prompts ON prompts.id = prompts_fts.rowid "
+                "WHERE prompts_fts MATCH ? ORDER BY prompts.created_at DESC",
+                (phrase,)
+            )
+            return [SavedPrompt.from_row(r) for r in rows]
         rows = self.execute(
             "SELECT * FROM prompts WHERE task LIKE ? OR tags LIKE ? ORDER BY created_at DESC",
             (f"%{query}%", f"%{query}%")
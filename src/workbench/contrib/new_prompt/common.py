@@ -19,3 +19,10 @@ TECHNIQUES = [
     (PromptType.SELF_CONSISTENCY, "Self-Consistency", "🔄", "white",
      "Multiple solutions for verification & consensus"),
 ]
+
+TECHNIQUE_COUNT = len(TECHNIQUES)
+
+# Technique picker entries, formatted once; the last entry is "back"
+MENU_OPTIONS = tuple(f"{icon} {name:<20} - {desc}" for _, name, icon, _, desc in TECHNIQUES) + (
+    "🔙 Back to Main Menu",
+)
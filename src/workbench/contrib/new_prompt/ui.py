@@ -1,25 +1,60 @@
 """UI components for the new prompt feature."""
 
+from functools import lru_cache
 from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
+from rich.text import Text
 from rich import box
 
 from src.core import PromptType, PromptConfig
 from src.platform.clipboard import copy_to_clipboard, is_clipboard_available
-from .common import TECHNIQUES
+from src.platform.terminal import read_lines
+from .common import TECHNIQUES, TECHNIQUE_COUNT, MENU_OPTIONS
 
-try:
-    from simple_term_menu import TerminalMenu
-    MENU_AVAILABLE = True
-except ImportError:
-    MENU_AVAILABLE = False
+@lru_cache(maxsize=1)
+def _terminal_menu_cls():
+    """TerminalMenu class, imported on first use; None if simple_term_menu is missing."""
+    try:
+        from simple_term_menu import TerminalMenu
+    except ImportError:
+        return None
+    return TerminalMenu
+
+
+# Characters of the prompt shown in the live preview panel
+PREVIEW_CHARS = 500
+
+# Parsed once; prompt_actions reprints these every loop
+_ACTIONS_HINT = Text.from_markup("\n[bold]Actions:[/] [cyan]c[/]=copy [yellow]f[/]=favorite [dim]Enter[/]=continue")
+_COPIED = Text.from_markup("[green]📋 Copied to clipboard![/]")
+_PASTE_CUE = Text.from_markup("[dim]Paste below, then press Enter on an empty line[/]")
+_COPY_FAILED = Text.from_markup("[red]Could not copy to clipboard[/]")
+_FAV_ADDED = Text.from_markup("[yellow]⭐ Added to favorites[/]")
+_FAV_REMOVED = Text.from_markup("[dim]Removed from favorites[/]")
+
+# Prompt labels parsed once instead of on every ask
+_ASK_TASK = Text.from_markup("\n[bold cyan]📝 What is your task/question?[/]", style="prompt")
+_ASK_CONTEXT = Text.from_markup("[bold blue]📖 Context[/] [dim](optional, Enter to skip)[/]", style="prompt")
+_ASK_ROLE = Text.from_markup("[bold magenta]🎭 Role/Persona[/] [dim](e.g., 'senior Python developer')[/]", style="prompt")
+_ASK_FORMAT = Text.from_markup("[bold yellow]📋 Output format[/] [dim](e.g., JSON, Markdown, Table)[/]", style="prompt")
+_ASK_CONSTRAINTS = Text.from_markup("[bold]Add constraints?[/]", style="prompt")
+_ASK_INPUT = Text.from_markup("  [cyan]Input[/] [dim](or 'done')[/]", style="prompt")
+_ASK_OUTPUT = Text.from_markup("  [green]Output[/]", style="prompt")
+_ASK_TAGS = Text.from_markup("\n[bold]🏷️  Tags[/] [dim](comma-separated, Enter to skip)[/]", style="prompt")
+_ASK_ACTION = Text.from_markup("[bold]Action[/]", style="prompt")
+_ASK_BULK_EXAMPLES = Text.from_markup("[bold green]Paste examples in bulk?[/] [dim](one 'input -> output' per line)[/]", style="prompt")
+_ASK_BULK_CONSTRAINTS = Text.from_markup("[bold yellow]Paste constraints in bulk?[/] [dim](one per line)[/]", style="prompt")
+
+# Separates input from output on a bulk example line
+EXAMPLE_SEPARATOR = "->"
 
 
 def interactive_select(options: list[str], title: str = "") -> Optional[int]:
     """Show an interactive selection menu."""
-    if MENU_AVAILABLE:
+    TerminalMenu = _terminal_menu_cls()
+    if TerminalMenu is not None:
         menu = TerminalMenu(options, title=title)
         return menu.show()
     else:
@@ -36,19 +71,14 @@ def interactive_select(options: list[str], title: str = "") -> Optional[int]:
 
 def select_technique(console: Console) -> tuple[Optional[PromptType], str]:
     """Let user select a prompt engineering technique."""
-    menu_options = []
-    for _, name, icon, _, desc in TECHNIQUES:
-        menu_options.append(f"{icon} {name:<20} - {desc}")
-    menu_options.append("🔙 Back to Main Menu")
-    
     console.print("\n[bold]Select a technique[/] [dim](↑↓ to navigate, Enter to select)[/]\n")
     
-    idx = interactive_select(menu_options, title="")
+    idx = interactive_select(list(MENU_OPTIONS), title="")
     
-    if idx is None or idx == len(TECHNIQUES):
+    if idx is None or idx == TECHNIQUE_COUNT:
         return None, ""
     
-    if 0 <= idx < len(TECHNIQUES):
+    if 0 <= idx < TECHNIQUE_COUNT:
         ptype, name, icon, color, _ = TECHNIQUES[idx]
         console.print(f"\n[{color}]✓ Selected: {icon} {name}[/]\n")
         return ptype, color
@@ -65,50 +95,67 @@ def gather_config(console: Console, prompt_type: PromptType, color: str,
         box=box.ROUNDED
     ))
     
-    task = Prompt.ask("\n[bold cyan]📝 What is your task/question?[/]")
-    context = Prompt.ask("[bold blue]📖 Context[/] [dim](optional, Enter to skip)[/]", default="")
+    task = Prompt.ask(_ASK_TASK)
+    context = Prompt.ask(_ASK_CONTEXT, default="")
     
     config = PromptConfig(task=task, context=context)
+    last_preview = None
+    
+    def preview() -> None:
+        # Skipped optional steps leave the prompt unchanged; don't re-render it
+        nonlocal last_preview
+        key = _preview_key(prompt_type, config)
+        if key != last_preview:
+            last_preview = key
+            show_preview(console, builder, token_counter, prompt_type, config, color)
     
     if preview_mode:
-        show_preview(console, builder, token_counter, prompt_type, config, color)
+        preview()
     
     # Type-specific configuration
     if prompt_type == PromptType.FEW_SHOT:
         config.examples = gather_examples(console)
         if preview_mode:
-            show_preview(console, builder, token_counter, prompt_type, config, color)
+            preview()
     elif prompt_type == PromptType.ROLE_BASED:
-        config.role = Prompt.ask("[bold magenta]🎭 Role/Persona[/] [dim](e.g., 'senior Python developer')[/]", default="")
+        config.role = Prompt.ask(_ASK_ROLE, default="")
         if preview_mode:
-            show_preview(console, builder, token_counter, prompt_type, config, color)
+            preview()
     elif prompt_type == PromptType.STRUCTURED:
-        config.output_format = Prompt.ask("[bold yellow]📋 Output format[/] [dim](e.g., JSON, Markdown, Table)[/]", default="")
+        config.output_format = Prompt.ask(_ASK_FORMAT, default="")
         if preview_mode:
-            show_preview(console, builder, token_counter, prompt_type, config, color)
+            preview()
     
-    if Confirm.ask("[bold]Add constraints?[/]", default=False):
+    if Confirm.ask(_ASK_CONSTRAINTS, default=False):
         config.constraints = gather_constraints(console)
         if preview_mode:
-            show_preview(console, builder, token_counter, prompt_type, config, color)
+            preview()
     
     return config
 
 
 def gather_examples(console: Console) -> list[dict]:
     """Gather few-shot examples from user."""
+    if Confirm.ask(_ASK_BULK_EXAMPLES, default=False):
+        console.print(_PASTE_CUE)
+        lines = read_lines(console)
+        examples = parse_bulk_examples(lines)
+        skipped = len(lines) - len(examples)
+        console.print(f"  [dim]✓ Added {len(examples)} examples" + (f", skipped {skipped} without '{EXAMPLE_SEPARATOR}'" if skipped else "") + "[/]\n")
+        return examples
+    
     examples = []
     console.print("\n[bold green]📚 Provide examples[/] [dim](type 'done' when finished)[/]\n")
     
     while True:
         num = len(examples) + 1
         console.print(f"[bold]Example {num}[/]")
-        inp = Prompt.ask("  [cyan]Input[/] [dim](or 'done')[/]")
+        inp = Prompt.ask(_ASK_INPUT)
         
         if inp.lower() == 'done':
             break
         
-        out = Prompt.ask("  [green]Output[/]")
+        out = Prompt.ask(_ASK_OUTPUT)
         examples.append({"input": inp, "output": out})
         console.print(f"  [dim]✓ Added[/]\n")
     
@@ -117,6 +164,10 @@ def gather_examples(console: Console) -> list[dict]:
 
 def gather_constraints(console: Console) -> list[str]:
     """Gather constraints from user."""
+    if Confirm.ask(_ASK_BULK_CONSTRAINTS, default=False):
+        console.print(_PASTE_CUE)
+        return [line.strip() for line in read_lines(console)]
+    
     constraints = []
     console.print("\n[bold yellow]⚠️  Enter constraints[/] [dim](type 'done' when finished)[/]\n")
     
@@ -131,17 +182,43 @@ def gather_constraints(console: Console) -> list[str]:
     return constraints
 
 
+def _preview_key(prompt_type: PromptType, config: PromptConfig) -> tuple:
+    """Everything gather_config can change that affects the built prompt."""
+    return (
+        prompt_type,
+        config.task,
+        config.context,
+        tuple((e["input"], e["output"]) for e in config.examples),
+        config.role,
+        config.output_format,
+        tuple(config.constraints),
+    )
+
+
+def parse_bulk_examples(lines: list[str]) -> list[dict]:
+    """Turn 'input -> output' lines into examples; lines without the separator are skipped."""
+    examples = []
+    for line in lines:
+        inp, sep, out = line.partition(EXAMPLE_SEPARATOR)
+        if sep and inp.strip():
+            examples.append({"input": inp.strip(), "output": out.strip()})
+    return examples
+
+
 def show_preview(console: Console, builder, token_counter, prompt_type: PromptType, 
                  config: PromptConfig, color: str) -> None:
     """Show a live preview of the prompt being built."""
     preview = builder.build(prompt_type, config)
-    token_count = token_counter.count_tokens(preview)
+    # Each step adds or edits a few paragraphs; only those get re-tokenized
+    token_count = token_counter.count_tokens_incremental(preview)
     
-    preview_text = preview[:500] + "..." if len(preview) > 500 else preview
+    preview_text = preview[:PREVIEW_CHARS] + "..." if len(preview) > PREVIEW_CHARS else preview
     console.print()
+    # Plain Text skips markup parsing of the prompt body (and keeps brackets
+    # in user input from being read as tags)
     console.print(Panel(
-        f"[dim]{preview_text}[/]",
-        title=f"[dim]👁️ Preview ({token_count} tokens)[/]",
+        Text(preview_text, style="dim"),
+        title=Text(f"👁️ Preview ({token_count} tokens)", style="dim"),
         border_style="dim",
         box=box.ROUNDED,
         padding=(0, 1)
@@ -159,37 +236,43 @@ def display_result(console: Console, prompt: str, color: str, token_counter, con
         padding=(1, 2)
     ))
     
-    # Show token count
-    token_count = token_counter.count_tokens(prompt)
+    # Show token count (paragraphs already counted by the preview are reused)
+    token_count = token_counter.count_tokens_incremental(prompt)
     console.print(f"\n[dim]📊 Token count: ~{token_count} tokens[/]")
 
 
 def ask_tags(console: Console) -> list[str]:
     """Ask for optional tags."""
-    tags_input = Prompt.ask("\n[bold]🏷️  Tags[/] [dim](comma-separated, Enter to skip)[/]", default="")
+    tags_input = Prompt.ask(_ASK_TAGS, default="")
     if tags_input:
         return [t.strip() for t in tags_input.split(",") if t.strip()]
     return []
 
 
 def prompt_actions(console: Console, prompt_id: int, prompt: str, history) -> None:
-    """Offer actions after prompt creation."""
+    """Offer actions after prompt creation (shared with the combine feature)."""
     if is_clipboard_available():
         if copy_to_clipboard(prompt):
-            console.print("[green]📋 Copied to clipboard![/]")
+            console.print(_COPIED)
     
     while True:
-        console.print("\n[bold]Actions:[/] [cyan]c[/]=copy [yellow]f[/]=favorite [dim]Enter[/]=continue")
-        action = Prompt.ask("[bold]Action[/]", default="")
-        
-        if action == "c":
-            if copy_to_clipboard(prompt):
-                console.print("[green]📋 Copied to clipboard![/]")
-            else:
-                console.print("[red]Could not copy to clipboard[/]")
-        elif action == "f":
-            is_fav = history.toggle_favorite(prompt_id)
-            status = "[yellow]⭐ Added to favorites[/]" if is_fav else "[dim]Removed from favorites[/]"
-            console.print(status)
-        else:
+        console.print(_ACTIONS_HINT)
+        handler = _PROMPT_ACTIONS.get(Prompt.ask(_ASK_ACTION, default=""))
+        if handler is None:
             break
+        handler(console, prompt_id, prompt, history)
+
+
+def _copy_prompt(console: Console, prompt_id: int, prompt: str, history) -> None:
+    console.print(_COPIED if copy_to_clipboard(prompt) else _COPY_FAILED)
+
+
+def _toggle_favorite(console: Console, prompt_id: int, prompt: str, history) -> None:
+    console.print(_FAV_ADDED if history.toggle_favorite(prompt_id) else _FAV_REMOVED)
+
+
+# prompt_actions choices; anything else continues
+_PROMPT_ACTIONS = {
+    "c": _copy_prompt,
+    "f": _toggle_favorite,
+}
@@ -31,12 +31,6 @@ async def run(ctx: FeatureContext) -> FeatureResult:
     from rich.panel import Panel
     from .service import NaturalLanguageGenerator
     
-    if not ctx.llm_client:
-        return FeatureResult(
-            success=False,
-            error="LLM client not available. Please configure an API key."
-        )
-    
     generator = NaturalLanguageGenerator(ctx.llm_client)
     
     ctx.console.print("\n[bold bright_magenta]💬 Natural Language Prompt Generator[/]")
@@ -4,6 +4,13 @@ Optimizer feature manifest - AI-powered prompt optimization.
 Requirements: 2.1, 2.2, 2.3, 1.5
 """
 
+from rich import box
+from rich.console import Group
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from src.platform.terminal import read_lines
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -24,34 +31,31 @@ MANIFEST = FeatureManifest(
 )
 
 
+# (bar, color) for every 0-10 score the optimizer can report
+_SCORE_BARS = tuple(
+    ("█" * s + "░" * (10 - s), "green" if s >= 7 else "yellow" if s >= 5 else "red")
+    for s in range(11)
+)
+
+
+# (header, add_column options) for the scores table
+_SCORES_COLUMNS = (
+    ("Metric", {"style": "bold"}),
+    ("Score", {"justify": "center"}),
+    ("Bar", {"width": 20}),
+)
+
+
 async def run(ctx: FeatureContext) -> FeatureResult:
     """Run the optimizer feature - analyze and improve prompts."""
     # Import dependencies inside function to avoid module-level import issues
-    from rich.prompt import Prompt
-    from rich.panel import Panel
-    from rich.table import Table
-    from rich import box
     from .service import OptimizerService
     
-    if not ctx.llm_client:
-        return FeatureResult(
-            success=False,
-            error="LLM client not available. Please configure an API key."
-        )
-    
     ctx.console.print("\n[bold cyan]🔧 Prompt Optimizer[/]")
     ctx.console.print("[dim]Paste your prompt to analyze and optimize.[/]")
     ctx.console.print("[dim]Enter an empty line when done.[/]\n")
     
-    # Collect multi-line prompt
-    lines = []
-    while True:
-        line = Prompt.ask("", default="")
-        if not line:
-            break
-        lines.append(line)
-    
-    prompt = "\n".join(lines)
+    prompt = "\n".join(read_lines(ctx.console))
     
     if not prompt.strip():
         return FeatureResult(success=False, message="No prompt provided")
@@ -64,37 +68,39 @@ async def run(ctx: FeatureContext) -> FeatureResult:
     if result.error:
         return FeatureResult(success=False, error=result.error)
     
-    # Display results
-    ctx.console.print("\n[bold green]✨ Optimized Prompt:[/]")
-    ctx.console.print(Panel(result.optimized_prompt, border_style="green"))
-    
     # Display scores
     scores_table = Table(box=box.SIMPLE, show_header=False)
-    scores_table.add_column("Metric", style="bold")
-    scores_table.add_column("Score", justify="center")
-    scores_table.add_column("Bar", width=20)
+    for header, options in _SCORES_COLUMNS:
+        scores_table.add_column(header, **options)
     
     for name, score in [
         ("Clarity", result.clarity_score),
         ("Specificity", result.specificity_score),
         ("Effectiveness", result.effectiveness_score),
     ]:
-        bar = "█" * score + "░" * (10 - score)
-        color = "green" if score >= 7 else "yellow" if score >= 5 else "red"
+        # Scores come from model JSON; keep them on the 0-10 integer scale
+        score = max(0, min(10, int(score)))
+        bar, color = _SCORE_BARS[score]
         scores_table.add_row(name, f"[{color}]{score}/10[/]", f"[{color}]{bar}[/]")
     
-    ctx.console.print("\n[bold]Scores:[/]")
-    ctx.console.print(scores_table)
+    # Display results in one print; model output is plain Text, not markup
+    items = [
+        Text("\n✨ Optimized Prompt:", style="bold green"),
+        Panel(Text(result.optimized_prompt), border_style="green"),
+        Text("\nScores:", style="bold"),
+        scores_table,
+    ]
     
-    # Display suggestions
     if result.suggestions:
-        ctx.console.print("\n[bold]Suggestions:[/]")
+        suggestions = Text("\nSuggestions:", style="bold")
         for i, suggestion in enumerate(result.suggestions, 1):
-            ctx.console.print(f"  {i}. {suggestion}")
+            suggestions.append(f"\n  {i}. {suggestion}")
+        items.append(suggestions)
     
-    # Display explanation
     if result.explanation:
-        ctx.console.print(f"\n[bold]Explanation:[/] {result.explanation}")
+        items.append(Text.assemble(("\nExplanation:", "bold"), f" {result.explanation}"))
+    
+    ctx.console.print(Group(*items))
     
     return FeatureResult(
         success=True,
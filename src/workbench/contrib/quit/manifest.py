@@ -1,5 +1,8 @@
 """Manifest for the Quit feature."""
 
+from rich import box
+from rich.panel import Panel
+
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -21,9 +24,6 @@ MANIFEST = FeatureManifest(
 
 def run(ctx: FeatureContext) -> FeatureResult:
     """Exit the application."""
-    from rich.panel import Panel
-    from rich import box
-    
     ctx.console.print(Panel(
         "[bold green]Happy prompting! 🎯[/]\n[dim]May your tokens be ever efficient.[/]",
         border_style="green",
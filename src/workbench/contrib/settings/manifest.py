@@ -19,6 +19,15 @@ MANIFEST = FeatureManifest(
 )
 
 
+_MENU_OPTIONS = (
+    "🔑 Set OpenAI API Key",
+    "🔑 Set Anthropic API Key",
+    "🔑 Set Google API Key",
+    "🎯 Set Default Model",
+    "🔙 Back",
+)
+
+
 def run(ctx: FeatureContext) -> FeatureResult:
     """Settings and configuration menu."""
     from .ui import interactive_select, show_status, set_api_key, set_default_model
@@ -26,15 +35,7 @@ def run(ctx: FeatureContext) -> FeatureResult:
     while True:
         show_status(ctx.console, ctx.config)
         
-        menu_options = [
-            "🔑 Set OpenAI API Key",
-            "🔑 Set Anthropic API Key",
-            "🔑 Set Google API Key",
-            "🎯 Set Default Model",
-            "🔙 Back",
-        ]
-        
-        idx = interactive_select(menu_options, title="")
+        idx = interactive_select(_MENU_OPTIONS, title="")
         
         if idx is None or idx == 4:
             break
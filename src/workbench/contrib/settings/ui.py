@@ -1,8 +1,11 @@
 """UI components for the settings feature."""
 
+from functools import lru_cache
 from typing import Optional
-from rich.console import Console
+from weakref import WeakKeyDictionary
+from rich.console import Console, Group
 from rich.prompt import Prompt
+from rich.text import Text
 
 try:
     from simple_term_menu import TerminalMenu
@@ -11,10 +14,39 @@ except ImportError:
     MENU_AVAILABLE = False
 
 
+# Menu suffix shown after each known model in the default-model picker
+_MODEL_INFO = {
+    "gpt-4.1": " (Flagship, 1M context)",
+    "gpt-4.1-mini": " (Balanced)",
+    "gpt-4.1-nano": " (Cheapest, fast)",
+    "o4-mini": " (Reasoning model)",
+    "gpt-4o": " (Legacy)",
+    "claude-sonnet-4-5-20250929": " (Best balance)",
+    "claude-opus-4-5-20251124": " (Most capable)",
+    "claude-haiku-4-5-20251015": " (Cheapest, fast)",
+    "gemini-2.5-pro": " (Most capable)",
+    "gemini-2.5-flash": " (Fast, balanced)",
+    "gemini-2.5-flash-lite": " (Cheapest, fast)",
+}
+
+
+# Rendered status block per config, with the config revision it was built at
+_STATUS_CACHE: "WeakKeyDictionary[object, tuple[int, Group]]" = WeakKeyDictionary()
+
+# Default-model menu entries per config, with the model list they were built from
+_MENU_CACHE: "WeakKeyDictionary[object, tuple[list, list[str]]]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=8)
+def _terminal_menu(options: tuple[str, ...], title: str):
+    """Build each distinct menu once; TerminalMenu probes the terminal on construction and can be shown repeatedly."""
+    return TerminalMenu(list(options), title=title)
+
+
 def interactive_select(options: list[str], title: str = "") -> Optional[int]:
     """Show an interactive selection menu."""
     if MENU_AVAILABLE:
-        menu = TerminalMenu(options, title=title)
+        menu = _terminal_menu(tuple(options), title)
         return menu.show()
     else:
         print(f"\n{title}" if title else "")
@@ -30,6 +62,14 @@ def interactive_select(options: list[str], title: str = "") -> Optional[int]:
 
 def show_status(console: Console, config) -> None:
     """Show current API key status."""
+    cached = _STATUS_CACHE.get(config)
+    if cached is None or cached[0] != config.revision:
+        cached = (config.revision, _render_status(config))
+        _STATUS_CACHE[config] = cached
+    console.print(cached[1])
+
+
+def _render_status(config) -> Group:
     default_provider, default_model = config.get_default_model()
     
     status_lines = []
@@ -39,9 +79,11 @@ def show_status(console: Console, config) -> None:
     
     default_display = f"{default_provider}/{default_model}" if default_provider else "Not set"
     
-    console.print("\n[bold]⚙️ Settings[/]\n")
-    console.print(f"API Keys: {' | '.join(status_lines)}")
-    console.print(f"Default Model: {default_display}\n")
+    return Group(
+        Text("\n⚙️ Settings\n", style="bold"),
+        Text(f"API Keys: {' | '.join(status_lines)}"),
+        Text(f"Default Model: {default_display}\n"),
+    )
 
 
 def set_api_key(console: Console, provider: str, config, app_state) -> None:
@@ -50,10 +92,13 @@ def set_api_key(console: Console, provider: str, config, app_state) -> None:
     
     if key:
         config.set_api_key(provider, key)
-        # Reinitialize LLM client
+        # Re-key the existing client instead of rebuilding it
         if app_state:
-            from src.services.llm.client import LLMClient
-            app_state.llm_client = LLMClient(config)
+            if app_state.llm_client is None:
+                from src.services.llm.client import LLMClient
+                app_state.llm_client = LLMClient(config)
+            else:
+                app_state.llm_client.refresh(provider)
         console.print(f"[green]✓ {provider.capitalize()} API key saved[/]")
 
 
@@ -65,25 +110,15 @@ def set_default_model(console: Console, config, app_state) -> None:
         console.print("[yellow]No API keys configured. Add keys first.[/]")
         return
     
-    model_info = {
-        "gpt-4.1": "Flagship, 1M context",
-        "gpt-4.1-mini": "Balanced",
-        "gpt-4.1-nano": "Cheapest, fast",
-        "o4-mini": "Reasoning model",
-        "gpt-4o": "Legacy",
-        "claude-sonnet-4-5-20250929": "Best balance",
-        "claude-opus-4-5-20251124": "Most capable",
-        "claude-haiku-4-5-20251015": "Cheapest, fast",
-        "gemini-2.5-pro": "Most capable",
-        "gemini-2.5-flash": "Fast, balanced",
-        "gemini-2.5-flash-lite": "Cheapest, fast",
-    }
-    
-    menu_options = []
-    for provider, model in available_models:
-        info = model_info.get(model, "")
-        info_str = f" ({info})" if info else ""
-        menu_options.append(f"{provider}: {model}{info_str}")
+    # The config hands back the same list object until keys change
+    cached = _MENU_CACHE.get(config)
+    if cached is None or cached[0] is not available_models:
+        cached = (available_models, [
+            f"{provider}: {model}{_MODEL_INFO.get(model, '')}"
+            for provider, model in available_models
+        ])
+        _MENU_CACHE[config] = cached
+    menu_options = cached[1]
     
     console.print("\n[bold]Select Default Model[/]\n")
     
@@ -93,7 +128,8 @@ def set_default_model(console: Console, config, app_state) -> None:
         provider, model = available_models[idx]
         config.set_default_model(provider, model)
         
-        if app_state:
+        # The client resolves the default from config on every call
+        if app_state and app_state.llm_client is None:
             from src.services.llm.client import LLMClient
             app_state.llm_client = LLMClient(config)
         
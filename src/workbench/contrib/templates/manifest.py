@@ -4,6 +4,11 @@ Templates feature manifest - custom prompt template management.
 Requirements: 2.1, 2.2, 2.3
 """
 
+from rich import box
+from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.table import Table
+
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -24,21 +29,25 @@ MANIFEST = FeatureManifest(
 )
 
 
+_MENU = (
+    "\n[bold green]📋 Custom Templates[/]\n"
+    "1. List templates\n"
+    "2. Use a template\n"
+    "3. View template details\n"
+    "4. Open config file\n"
+    "5. Back to menu"
+)
+
+
 def run(ctx: FeatureContext) -> FeatureResult:
     """Run the templates feature - manage and use custom templates."""
     # Import dependencies inside function to avoid module-level import issues
-    from rich.prompt import Prompt
     from .service import TemplateService
     
     template_service = TemplateService()
     
     while True:
-        ctx.console.print("\n[bold green]📋 Custom Templates[/]")
-        ctx.console.print("1. List templates")
-        ctx.console.print("2. Use a template")
-        ctx.console.print("3. View template details")
-        ctx.console.print("4. Open config file")
-        ctx.console.print("5. Back to menu")
+        ctx.console.print(_MENU)
         
         choice = Prompt.ask("Select option", choices=["1", "2", "3", "4", "5"], default="1")
         
@@ -52,6 +61,7 @@ def run(ctx: FeatureContext) -> FeatureResult:
             config_path = template_service.get_config_path()
             ctx.console.print(f"\n[bold]Config file:[/] {config_path}")
             ctx.console.print("[dim]Edit this file to add or modify templates.[/]")
+            template_service.invalidate()
         elif choice == "5":
             break
     
@@ -60,9 +70,6 @@ def run(ctx: FeatureContext) -> FeatureResult:
 
 def _list_templates(ctx: FeatureContext, service) -> None:
     """List all available templates."""
-    from rich.table import Table
-    from rich import box
-    
     templates = service.list_templates()
     
     if not templates:
@@ -82,22 +89,23 @@ def _list_templates(ctx: FeatureContext, service) -> None:
     ctx.console.print(table)
 
 
+def _print_choices(ctx: FeatureContext, header: str, templates) -> None:
+    """Print a numbered template list under a header in one call."""
+    lines = [f"\n[bold]{header}[/]"]
+    lines.extend(f"  {i}. {tpl.icon} [cyan]{tpl.name}[/]" for i, tpl in enumerate(templates, 1))
+    ctx.console.print("\n".join(lines))
+
+
 def _use_template(ctx: FeatureContext, service) -> None:
     """Use a template to generate a prompt."""
-    from rich.prompt import Prompt
-    from rich.panel import Panel
-    
     templates = service.list_templates()
     
     if not templates:
         ctx.console.print("[dim]No templates available.[/]")
         return
     
-    ctx.console.print("\n[bold]Select a template:[/]")
-    template_keys = list(service.templates.keys())
-    for i, key in enumerate(template_keys, 1):
-        tpl = service.templates[key]
-        ctx.console.print(f"  {i}. {tpl.icon} [cyan]{tpl.name}[/]")
+    _print_choices(ctx, "Select a template:", templates)
+    template_keys = service.template_keys
     
     selection = Prompt.ask("Template #", default="1")
     
@@ -105,7 +113,7 @@ def _use_template(ctx: FeatureContext, service) -> None:
         idx = int(selection) - 1
         if 0 <= idx < len(template_keys):
             key = template_keys[idx]
-            tpl = service.templates[key]
+            tpl = templates[idx]
             
             # Collect variable values
             variables = {}
@@ -135,20 +143,14 @@ def _use_template(ctx: FeatureContext, service) -> None:
 
 def _view_template(ctx: FeatureContext, service) -> None:
     """View details of a specific template."""
-    from rich.prompt import Prompt
-    from rich.panel import Panel
-    
     templates = service.list_templates()
     
     if not templates:
         ctx.console.print("[dim]No templates available.[/]")
         return
     
-    ctx.console.print("\n[bold]Select a template to view:[/]")
-    template_keys = list(service.templates.keys())
-    for i, key in enumerate(template_keys, 1):
-        tpl = service.templates[key]
-        ctx.console.print(f"  {i}. {tpl.icon} [cyan]{tpl.name}[/]")
+    _print_choices(ctx, "Select a template to view:", templates)
+    template_keys = service.template_keys
     
     selection = Prompt.ask("Template #", default="1")
     
@@ -156,7 +158,7 @@ def _view_template(ctx: FeatureContext, service) -> None:
         idx = int(selection) - 1
         if 0 <= idx < len(template_keys):
             key = template_keys[idx]
-            tpl = service.templates[key]
+            tpl = templates[idx]
             
             ctx.console.print(f"\n[bold]{tpl.icon} {tpl.name}[/]")
             ctx.console.print(f"[dim]{tpl.description}[/]")
@@ -65,7 +65,41 @@ class TemplateService:
             config_path = str(get_config_dir() / "templates.yaml")
         self.config_path = config_path
         self._ensure_config_exists()
-        self.templates = self._load_templates()
+        self._stamp: Optional[tuple[int, int]] = None
+        self._templates: dict[str, CustomTemplate] = {}
+        self._template_keys: tuple[str, ...] = ()
+        self._template_list: tuple[CustomTemplate, ...] = ()
+
+    def _file_stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            st = Path(self.config_path).stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _refresh(self) -> None:
+        """Reload templates.yaml if it changed since the last read."""
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
+        self._stamp = stamp
+        self._templates = self._load_templates()
+        self._template_keys = tuple(self._templates)
+        self._template_list = tuple(self._templates.values())
+
+    def invalidate(self) -> None:
+        """Force the next access to re-read templates.yaml."""
+        self._stamp = None
+
+    @property
+    def templates(self) -> dict[str, CustomTemplate]:
+        self._refresh()
+        return self._templates
+
+    @property
+    def template_keys(self) -> tuple[str, ...]:
+        self._refresh()
+        return self._template_keys
 
     def _ensure_config_exists(self) -> None:
         if not Path(self.config_path).exists():
@@ -94,8 +128,9 @@ class TemplateService:
         except Exception:
             return {}
 
-    def list_templates(self) -> list[CustomTemplate]:
-        return list(self.templates.values())
+    def list_templates(self) -> tuple[CustomTemplate, ...]:
+        self._refresh()
+        return self._template_list
 
     def get_template(self, key: str) -> Optional[CustomTemplate]:
         return self.templates.get(key)
@@ -29,3 +29,4 @@ class TestResult:
     latency_ms: int
     tokens_used: int
     error: Optional[str] = None
+    cached_tokens: int = 0
@@ -4,6 +4,14 @@ Testing feature manifest - test prompts across multiple LLM models.
 Requirements: 2.1, 2.2, 2.3
 """
 
+from rich import box
+from rich.console import Group
+from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.table import Table
+from rich.text import Text
+
+from src.platform.terminal import read_lines
 from src.workbench.contract import (
     FeatureManifest,
     FeatureCategory,
@@ -24,33 +32,47 @@ MANIFEST = FeatureManifest(
 )
 
 
+# Characters of each model response shown under the results table
+RESPONSE_PREVIEW_CHARS = 500
+
+# (header, add_column options) for the results summary table
+_RESULTS_COLUMNS = (
+    ("Provider", {"style": "cyan"}),
+    ("Model", {}),
+    ("Status", {"justify": "center"}),
+    ("Score", {"justify": "center"}),
+    ("Latency", {"justify": "right"}),
+    ("Tokens", {"justify": "right"}),
+)
+
+
+def _parse_selection(selection: str, count: int) -> list[int]:
+    """Turn '1, 3,x,3' into unique in-range 0-based indices, skipping bad tokens."""
+    indices: list[int] = []
+    seen: set[int] = set()
+    for token in selection.split(","):
+        try:
+            i = int(token) - 1
+        except ValueError:
+            continue
+        if 0 <= i < count and i not in seen:
+            seen.add(i)
+            indices.append(i)
+    return indices
+
+
 async def run(ctx: FeatureContext) -> FeatureResult:
     """Run the testing feature - test prompts across models."""
     # Import dependencies inside function to avoid module-level import issues
-    from rich.prompt import Prompt
     from .service import TestingService
     
-    if not ctx.llm_client:
-        return FeatureResult(
-            success=False,
-            error="LLM client not available. Please configure an API key."
-        )
-    
     testing_service = TestingService(ctx.llm_client)
     
     ctx.console.print("\n[bold red]🧪 Prompt Testing[/]")
     ctx.console.print("[dim]Test your prompt across multiple models.[/]")
     ctx.console.print("[dim]Enter your prompt (empty line to finish):[/]\n")
     
-    # Collect multi-line prompt
-    lines = []
-    while True:
-        line = Prompt.ask("", default="")
-        if not line:
-            break
-        lines.append(line)
-    
-    prompt = "\n".join(lines)
+    prompt = "\n".join(read_lines(ctx.console))
     
     if not prompt.strip():
         return FeatureResult(success=False, message="No prompt provided")
@@ -75,11 +97,8 @@ async def run(ctx: FeatureContext) -> FeatureResult:
     if selection.lower() == "all":
         models_to_test = available_models[:3]
     else:
-        try:
-            indices = [int(x.strip()) - 1 for x in selection.split(",")]
-            models_to_test = [available_models[i] for i in indices if 0 <= i < len(available_models)]
-        except (ValueError, IndexError):
-            models_to_test = available_models[:3]
+        indices = _parse_selection(selection, len(available_models))
+        models_to_test = [available_models[i] for i in indices] or available_models[:3]
     
     if not models_to_test:
         return FeatureResult(success=False, message="No models selected")
@@ -101,20 +120,10 @@ async def run(ctx: FeatureContext) -> FeatureResult:
 
 def _display_results(ctx: FeatureContext, results: list) -> None:
     """Display test results in a table."""
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich import box
-    
-    ctx.console.print("[bold]Test Results:[/]\n")
-    
     # Summary table
     table = Table(box=box.ROUNDED, border_style="red")
-    table.add_column("Provider", style="cyan")
-    table.add_column("Model")
-    table.add_column("Status", justify="center")
-    table.add_column("Score", justify="center")
-    table.add_column("Latency", justify="right")
-    table.add_column("Tokens", justify="right")
+    for header, options in _RESULTS_COLUMNS:
+        table.add_column(header, **options)
     
     for result in results:
         status = "[green]✓ Pass[/]" if result.passed else "[red]✗ Fail[/]"
@@ -123,26 +132,29 @@ def _display_results(ctx: FeatureContext, results: list) -> None:
         
         score_color = "green" if result.score >= 80 else "yellow" if result.score >= 50 else "red"
         
+        tokens = str(result.tokens_used)
+        if result.cached_tokens:
+            tokens += f" [dim]({result.cached_tokens} cached)[/]"
+        
         table.add_row(
             result.provider,
             result.model,
             status,
             f"[{score_color}]{result.score:.0f}%[/]",
             f"{result.latency_ms}ms",
-            str(result.tokens_used)
+            tokens
         )
     
-    ctx.console.print(table)
-    
-    # Show responses
-    ctx.console.print("\n[bold]Responses:[/]")
+    # Everything goes out in one print; model output is plain Text, not markup
+    items = [Text("Test Results:\n", style="bold"), table, Text("\nResponses:", style="bold")]
     for result in results:
-        ctx.console.print(f"\n[bold cyan][{result.provider}] {result.model}[/]")
+        items.append(Text.assemble("\n", (f"[{result.provider}] {result.model}", "bold cyan")))
         if result.error:
-            ctx.console.print(f"[red]Error: {result.error}[/]")
+            items.append(Text(f"Error: {result.error}", style="red"))
         else:
-            # Truncate long responses
             response = result.response
-            if len(response) > 500:
-                response = response[:500] + "..."
-            ctx.console.print(Panel(response, border_style="dim"))
+            if len(response) > RESPONSE_PREVIEW_CHARS:
+                response = response[:RESPONSE_PREVIEW_CHARS] + "..."
+            items.append(Panel(Text(response), border_style="dim"))
+    
+    ctx.console.print(Group(*items))
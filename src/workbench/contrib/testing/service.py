@@ -66,7 +66,8 @@ class TestingService:
         return TestResult(
             test_case=test_case, provider=provider, model=model,
             response=content, passed=passed, score=score, checks=checks,
-            latency_ms=latency_ms, tokens_used=response.input_tokens + response.output_tokens
+            latency_ms=latency_ms, tokens_used=response.input_tokens + response.output_tokens,
+            cached_tokens=response.cached_tokens
         )
 
     async def run_across_models(
@@ -80,4 +81,17 @@ class TestingService:
         
         test_case = TestCase(name="quick_test", input_vars={})
         tasks = [self.run_test(prompt, test_case, p, m) for p, m in models]
-        return await asyncio.gather(*tasks)
+        # Models run concurrently; one model raising must not discard the others' results
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            _failed_result(test_case, p, m, outcome) if isinstance(outcome, Exception) else outcome
+            for (p, m), outcome in zip(models, outcomes)
+        ]
+
+
+def _failed_result(test_case: TestCase, provider: str, model: str, exc: Exception) -> TestResult:
+    return TestResult(
+        test_case=test_case, provider=provider, model=model,
+        response="", passed=False, score=0, checks={},
+        latency_ms=0, tokens_used=0, error=str(exc) or type(exc).__name__
+    )
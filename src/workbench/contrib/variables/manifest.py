@@ -24,6 +24,17 @@ MANIFEST = FeatureManifest(
 )
 
 
+_MENU = (
+    "\n[bold bright_cyan]🔤 Variable Templates[/]\n"
+    "1. List templates\n"
+    "2. Use a template\n"
+    "3. Create new template\n"
+    "4. Quick interpolate\n"
+    "5. Delete template\n"
+    "6. Back to menu"
+)
+
+
 def run(ctx: FeatureContext) -> FeatureResult:
     """Run the variables feature - manage variable templates."""
     # Import dependencies inside function to avoid module-level import issues
@@ -33,13 +44,7 @@ def run(ctx: FeatureContext) -> FeatureResult:
     interpolator = VariableInterpolator()
     
     while True:
-        ctx.console.print("\n[bold bright_cyan]🔤 Variable Templates[/]")
-        ctx.console.print("1. List templates")
-        ctx.console.print("2. Use a template")
-        ctx.console.print("3. Create new template")
-        ctx.console.print("4. Quick interpolate")
-        ctx.console.print("5. Delete template")
-        ctx.console.print("6. Back to menu")
+        ctx.console.print(_MENU)
         
         choice = Prompt.ask("Select option", choices=["1", "2", "3", "4", "5", "6"], default="1")
         
@@ -95,9 +100,9 @@ def _use_template(ctx: FeatureContext, interpolator) -> None:
         ctx.console.print("[dim]No templates available. Create one first.[/]")
         return
     
-    ctx.console.print("\n[bold]Select a template:[/]")
-    for i, tpl in enumerate(templates, 1):
-        ctx.console.print(f"  {i}. [cyan]{tpl.name}[/] - {tpl.description}")
+    lines = ["\n[bold]Select a template:[/]"]
+    lines.extend(f"  {i}. [cyan]{tpl.name}[/] - {tpl.description}" for i, tpl in enumerate(templates, 1))
+    ctx.console.print("\n".join(lines))
     
     selection = Prompt.ask("Template #", default="1")
     
@@ -241,9 +246,9 @@ def _delete_template(ctx: FeatureContext, interpolator) -> None:
         ctx.console.print("[dim]No templates to delete.[/]")
         return
     
-    ctx.console.print("\n[bold]Select template to delete:[/]")
-    for i, tpl in enumerate(templates, 1):
-        ctx.console.print(f"  {i}. [cyan]{tpl.name}[/]")
+    lines = ["\n[bold]Select template to delete:[/]"]
+    lines.extend(f"  {i}. [cyan]{tpl.name}[/]" for i, tpl in enumerate(templates, 1))
+    ctx.console.print("\n".join(lines))
     
     selection = Prompt.ask("Template #", default="")
     
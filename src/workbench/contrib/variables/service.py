@@ -5,6 +5,7 @@ Feature #4: Variable Interpolation System
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional
 import json
 
@@ -30,11 +31,28 @@ class VariableTemplate:
     tags: list[str] = field(default_factory=list)
 
 
+# Pattern for {{variable}} or {{variable:default}}
+VAR_PATTERN = re.compile(r'\{\{(\w+)(?::([^}]*))?\}\}')
+
+
+@lru_cache(maxsize=256)
+def _split_template(template: str) -> tuple[Optional[str], ...]:
+    """Split a template once into [text, name, default, text, name, default, ..., text]."""
+    return tuple(VAR_PATTERN.split(template))
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, list):
+        return "\n".join(str(v) for v in value)
+    elif isinstance(value, dict):
+        return json.dumps(value, indent=2)
+    return str(value)
+
+
 class VariableInterpolator:
     """Handle variable interpolation in prompt templates."""
 
-    # Pattern for {{variable}} or {{variable:default}}
-    VAR_PATTERN = re.compile(r'\{\{(\w+)(?::([^}]*))?\}\}')
+    VAR_PATTERN = VAR_PATTERN
 
     def __init__(self):
         self.templates: dict[str, VariableTemplate] = {}
@@ -89,10 +107,10 @@ class VariableInterpolator:
         """Extract variable definitions from a template string."""
         variables = []
         seen = set()
+        parts = _split_template(template)
         
-        for match in self.VAR_PATTERN.finditer(template):
-            name = match.group(1)
-            default = match.group(2)
+        for i in range(1, len(parts), 3):
+            name, default = parts[i], parts[i + 1]
             
             if name not in seen:
                 seen.add(name)
@@ -121,26 +139,23 @@ class VariableInterpolator:
         Returns:
             Interpolated string
         """
-        def replace_var(match):
-            name = match.group(1)
-            default = match.group(2)
+        # The template is parsed once; each call only joins the pieces
+        parts = _split_template(template)
+        out = [parts[0]]
+        for i in range(1, len(parts), 3):
+            name, default = parts[i], parts[i + 1]
             
             if name in variables:
-                value = variables[name]
-                # Handle different types
-                if isinstance(value, list):
-                    return "\n".join(str(v) for v in value)
-                elif isinstance(value, dict):
-                    return json.dumps(value, indent=2)
-                return str(value)
+                out.append(_format_value(variables[name]))
             elif default is not None:
-                return default
+                out.append(default)
             elif strict:
                 raise ValueError(f"Missing required variable: {name}")
             else:
-                return match.group(0)  # Keep original placeholder
+                out.append("{{" + name + "}}")  # Keep original placeholder
+            out.append(parts[i + 2])
         
-        return self.VAR_PATTERN.sub(replace_var, template)
+        return "".join(out)
 
     def validate_variables(
         self,
@@ -6,17 +6,135 @@ It scans `src/contrib/` but lives in workbench to protect the infrastructure.
 Requirements: 3.1, 3.2, 2.1, 2.2, 2.3, 7.1, 7.2, 7.3, 7.4, 8.1, 8.2, 8.3, 8.4
 """
 
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional, Callable
+import ast
 import importlib.util
+import json
 import logging
+import operator
+import os
+import sys
+import threading
 
 from .contract import FeatureManifest, FeatureCategory, FeatureRunner, FeatureResult
 
 
 logger = logging.getLogger(__name__)
 
+# Manifest fields checked by _validate_manifest; category last
+_REQUIRED_FIELDS = operator.attrgetter('name', 'display_name', 'description', 'icon', 'color', 'category')
+
+# Bump when the cache file layout changes
+DISCOVERY_CACHE_VERSION = 1
+
+# Worker threads used to stat and read manifest files during discovery
+DISCOVERY_THREADS = 8
+
+# Serializes executing manifests, which discovery and deferred runs can do
+# from different threads
+_CODE_LOCK = threading.RLock()
+
+
+def _manifest_module_name(path: Path) -> str:
+    return f"src.workbench.contrib.{path.name}.manifest"
+
+
+def _import_manifest(path: Path):
+    """Execute a feature's manifest.py under its package name.
+
+    Returns None if no loader can be created for the file.
+    """
+    module_name = _manifest_module_name(path)
+    spec = importlib.util.spec_from_file_location(module_name, path / "manifest.py")
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    with _CODE_LOCK:
+        # Register in sys.modules so relative imports work
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            # Don't leave a half-executed module for _deferred to reuse
+            sys.modules.pop(module_name, None)
+            raise
+    return module
+
+
+def _static_value(node: ast.expr):
+    """Value of a manifest keyword that can be read without running code."""
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "FeatureCategory"
+    ):
+        return FeatureCategory[node.attr]
+    return ast.literal_eval(node)
+
+
+def _read_manifest_source(path: Path, source: Optional[bytes]) -> Optional[tuple[FeatureManifest, bool]]:
+    """Build MANIFEST from manifest.py's source without executing it.
+
+    Handles the usual ``MANIFEST = FeatureManifest(key=literal, ...)`` form
+    alongside top-level ``run``/``setup`` functions, returning the manifest and
+    whether ``setup`` exists. Returns None for anything else, so the caller
+    can fall back to importing the module and report errors as before.
+    A source of None means the file couldn't be read.
+    """
+    if source is None:
+        return None
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    call = None
+    functions = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.add(node.name)
+        elif (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == "MANIFEST"
+        ):
+            call = node.value
+    if (
+        "run" not in functions
+        or not isinstance(call, ast.Call)
+        or not isinstance(call.func, ast.Name)
+        or call.func.id != "FeatureManifest"
+        or call.args
+    ):
+        return None
+
+    try:
+        fields = {kw.arg: _static_value(kw.value) for kw in call.keywords if kw.arg}
+        if len(fields) != len(call.keywords):
+            return None
+        return FeatureManifest(**fields), "setup" in functions
+    except (ValueError, TypeError, KeyError, SyntaxError):
+        return None
+
+
+def _deferred(path: Path, attr: str) -> Callable:
+    """Stand-in for a manifest function that imports the manifest on first call."""
+    manifest_file = str(path / "manifest.py")
+
+    def call(ctx):
+        module = sys.modules.get(_manifest_module_name(path))
+        if module is None or getattr(module, "__file__", None) != manifest_file:
+            module = _import_manifest(path)
+        return getattr(module, attr)(ctx)
+
+    call.__name__ = attr
+    return call
+
 
 @dataclass
 class LoadedFeature:
@@ -73,18 +191,24 @@ class DiscoveryEngine:
     Requirements: 3.1, 3.2, 2.1, 2.2, 2.3
     """
 
-    def __init__(self, contrib_path: Optional[Path] = None):
+    def __init__(self, contrib_path: Optional[Path] = None, cache_path: Optional[Path] = None):
         """Initialize the discovery engine.
         
         Args:
             contrib_path: Path to the contrib directory. Defaults to src/workbench/contrib/
+            cache_path: JSON file remembering validated manifests between runs.
+                Unchanged manifests are then not imported until their feature
+                is first run. Caching is off when None.
         """
         if contrib_path is None:
             # Default to src/workbench/contrib/ relative to this file
             self.contrib_path = Path(__file__).parent / "contrib"
         else:
             self.contrib_path = contrib_path
+        self.cache_path = cache_path
         self.verbose = False
+        self._cache: dict[str, list] = {}
+        self._fresh_cache: dict[str, list] = {}
 
     def discover(self) -> DiscoveryResult:
         """Scan contrib directory and load all valid features.
@@ -95,85 +219,203 @@ class DiscoveryEngine:
         Requirements: 3.1, 3.2, 3.3
         """
         result = DiscoveryResult()
+        self._cache = self._load_cache()
+        self._fresh_cache = {}
 
         # Phase 1: Scan for manifest files
         candidates = self._scan_directories()
 
-        # Phase 2: Load and validate each manifest
+        # Phase 2: Stat and read manifest files on a small pool, then parse and
+        # validate them here in scan order. Parsing stays on one thread: on
+        # 3.11 concurrent ast.parse calls can fail with "SystemError: AST
+        # constructor recursion depth mismatch".
+        if len(candidates) > 1:
+            workers = min(DISCOVERY_THREADS, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="discovery") as pool:
+                reads = list(pool.map(self._read_candidate, candidates))
+        else:
+            reads = [self._read_candidate(candidate) for candidate in candidates]
+
         loaded = []
-        for path in candidates:
-            feature = self._load_feature(path, result)
+        for path, has_manifest, stamp, source in reads:
+            feature = self._load_feature(path, has_manifest, result, stamp, source)
             if feature:
                 loaded.append(feature)
 
         # Phase 3: Resolve dependencies and order
         result.features = self._resolve_dependencies(loaded, result)
 
+        # Entries for removed or failing manifests are dropped here
+        if self._fresh_cache != self._cache:
+            self._save_cache(self._fresh_cache)
+
         return result
 
-    def _scan_directories(self) -> list[Path]:
+    def _read_candidate(self, candidate: tuple[Path, bool]) -> tuple[Path, bool, Optional[list], Optional[bytes]]:
+        """Stat and read one candidate's manifest.py; safe to run on the pool.
+        
+        Returns (path, has_manifest, cache stamp, source). The source is
+        skipped when the cache already holds this exact file, and is None if
+        it couldn't be read.
+        """
+        path, has_manifest = candidate
+        if not has_manifest:
+            return path, False, None, None
+        
+        manifest_path = path / "manifest.py"
+        stamp = None
+        if self.cache_path is not None:
+            st = manifest_path.stat()
+            stamp = [st.st_mtime_ns, st.st_size]
+            entry = self._cache.get(str(manifest_path))
+            if entry and entry[:2] == stamp:
+                return path, True, stamp, None
+        try:
+            source = manifest_path.read_bytes()
+        except OSError:
+            source = None
+        return path, True, stamp, source
+
+    def _load_cache(self) -> dict[str, list]:
+        """Read cached manifests as {manifest path: [mtime_ns, size, fields]}."""
+        if self.cache_path is None:
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != DISCOVERY_CACHE_VERSION:
+            return {}
+        entries = data.get("manifests")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_cache(self, entries: dict[str, list]) -> None:
+        if self.cache_path is None:
+            return
+        data = {"version": DISCOVERY_CACHE_VERSION, "manifests": entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not write discovery cache: {e}")
+
+    def _load_cached_feature(self, path: Path, stamp: list) -> Optional[LoadedFeature]:
+        """Rebuild a feature from the cache if its manifest.py is unchanged."""
+        key = str(path / "manifest.py")
+        entry = self._cache.get(key)
+        if not entry or entry[:2] != stamp:
+            return None
+        try:
+            fields = dict(entry[2])
+            has_setup = fields.pop("has_setup")
+            fields["category"] = FeatureCategory(fields["category"])
+            manifest = FeatureManifest(**fields)
+        except (TypeError, ValueError, KeyError, IndexError):
+            # Written by an older contract; import the manifest instead
+            return None
+        self._fresh_cache[key] = entry
+        return self._deferred_feature(path, manifest, has_setup)
+
+    @staticmethod
+    def _deferred_feature(path: Path, manifest: FeatureManifest, has_setup: bool) -> LoadedFeature:
+        """A feature whose manifest module is imported when it first runs."""
+        return LoadedFeature(
+            manifest=manifest,
+            run=_deferred(path, "run"),
+            setup=_deferred(path, "setup") if has_setup else None,
+            module_path=str(path)
+        )
+
+    def _remember(self, path: Path, stamp: Optional[list], feature: LoadedFeature) -> None:
+        if stamp is None:
+            return
+        fields = asdict(feature.manifest)
+        fields["category"] = feature.manifest.category.value
+        fields["has_setup"] = feature.setup is not None
+        self._fresh_cache[str(path / "manifest.py")] = [*stamp, fields]
+
+    def _scan_directories(self) -> list[tuple[Path, bool]]:
         """Find all directories with manifest.py or service.py files.
         
         Returns:
-            List of paths to candidate feature directories.
+            List of (feature directory, has manifest.py) pairs.
             
         Requirements: 3.1
         """
         candidates = []
 
-        if not self.contrib_path.exists():
+        try:
+            entries = os.scandir(self.contrib_path)
+        except (FileNotFoundError, NotADirectoryError):
             return candidates
 
-        for item in self.contrib_path.iterdir():
-            if item.is_dir() and not item.name.startswith(('_', '.')):
-                manifest_path = item / "manifest.py"
-                if manifest_path.exists():
-                    candidates.append(item)
-                elif (item / "service.py").exists():
+        # DirEntry answers is_dir() from the directory listing on most platforms
+        with entries:
+            for entry in entries:
+                if entry.name.startswith(('_', '.')) or not entry.is_dir():
+                    continue
+                if os.path.isfile(os.path.join(entry.path, "manifest.py")):
+                    candidates.append((Path(entry.path), True))
+                elif os.path.isfile(os.path.join(entry.path, "service.py")):
                     # Legacy feature without manifest
-                    candidates.append(item)
+                    candidates.append((Path(entry.path), False))
 
         return candidates
 
-    def _load_feature(self, path: Path, result: DiscoveryResult) -> Optional[LoadedFeature]:
+    def _load_feature(
+        self,
+        path: Path,
+        has_manifest: bool,
+        result: DiscoveryResult,
+        stamp: Optional[list] = None,
+        source: Optional[bytes] = None,
+    ) -> Optional[LoadedFeature]:
         """Load a single feature from its directory.
         
         Args:
             path: Path to the feature directory
+            has_manifest: Whether the scan found a manifest.py there
             result: DiscoveryResult to append errors/warnings to
+            stamp: [mtime_ns, size] of manifest.py when caching is enabled
+            source: manifest.py's bytes from _read_candidate
             
         Returns:
             LoadedFeature if successful, None otherwise.
             
         Requirements: 2.1, 2.2, 2.3, 3.2
         """
-        manifest_path = path / "manifest.py"
-
         # Check for legacy feature
-        if not manifest_path.exists():
+        if not has_manifest:
             return self._load_legacy_feature(path, result)
 
+        if stamp is not None:
+            cached = self._load_cached_feature(path, stamp)
+            if cached:
+                return cached
+
+        # Most manifests can be read from source, leaving the import until run
+        static = _read_manifest_source(path, source)
+        if static:
+            manifest, has_setup = static
+            validation_error = self._validate_manifest(manifest, path)
+            if validation_error:
+                result.errors.append(validation_error)
+                return None
+            feature = self._deferred_feature(path, manifest, has_setup)
+            self._remember(path, stamp, feature)
+            return feature
+
         try:
             # Dynamic import of manifest module
             # Use full module path so relative imports work correctly
-            spec = importlib.util.spec_from_file_location(
-                f"src.workbench.contrib.{path.name}.manifest",
-                manifest_path
-            )
-            if spec is None or spec.loader is None:
+            module = _import_manifest(path)
+            if module is None:
                 result.errors.append(DiscoveryError(
                     feature_path=str(path),
                     error_type="import",
                     message="Failed to create module spec"
                 ))
                 return None
-                
-            module = importlib.util.module_from_spec(spec)
-            # Register in sys.modules so relative imports work
-            import sys
-            module_name = f"src.workbench.contrib.{path.name}.manifest"
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
 
             # Validate required exports
             if not hasattr(module, 'MANIFEST'):
@@ -200,12 +442,14 @@ class DiscoveryEngine:
                 result.errors.append(validation_error)
                 return None
 
-            return LoadedFeature(
+            feature = LoadedFeature(
                 manifest=manifest,
                 run=module.run,
                 setup=getattr(module, 'setup', None),
                 module_path=str(path)
             )
+            self._remember(path, stamp, feature)
+            return feature
 
         except Exception as e:
             result.errors.append(DiscoveryError(
@@ -227,6 +471,17 @@ class DiscoveryEngine:
             
         Requirements: 1.4, 9.2
         """
+        # Common case: every text field is a non-blank string and category is valid
+        try:
+            *texts, category = _REQUIRED_FIELDS(manifest)
+        except AttributeError:
+            pass
+        else:
+            if isinstance(category, FeatureCategory) and all(
+                type(value) is str and value.strip() for value in texts
+            ):
+                return None
+
         required_fields = ['name', 'display_name', 'description', 'icon', 'color', 'category']
 
         for field_name in required_fields:
@@ -334,31 +589,33 @@ class DiscoveryEngine:
         if not valid_features:
             return valid_features
             
-        # Topological sort (Kahn's algorithm)
+        # Topological sort (Kahn's algorithm) over dependency -> dependents edges
         in_degree = {f.manifest.name: 0 for f in valid_features}
+        dependents: dict[str, list[LoadedFeature]] = {name: [] for name in in_degree}
         for feature in valid_features:
             for dep in feature.manifest.dependencies:
                 if dep in in_degree:
                     in_degree[feature.manifest.name] += 1
+                    dependents[dep].append(feature)
 
-        queue = [f for f in valid_features if in_degree[f.manifest.name] == 0]
+        queue = deque(f for f in valid_features if in_degree[f.manifest.name] == 0)
         sorted_features = []
 
         while queue:
-            feature = queue.pop(0)
+            feature = queue.popleft()
             sorted_features.append(feature)
 
-            for other in valid_features:
-                if feature.manifest.name in other.manifest.dependencies:
-                    in_degree[other.manifest.name] -= 1
-                    if in_degree[other.manifest.name] == 0:
-                        queue.append(other)
+            for other in dependents[feature.manifest.name]:
+                in_degree[other.manifest.name] -= 1
+                if in_degree[other.manifest.name] == 0:
+                    queue.append(other)
 
         # Check for circular dependencies
         if len(sorted_features) != len(valid_features):
+            resolved = {f.manifest.name for f in sorted_features}
             circular = [
                 f.manifest.name for f in valid_features
-                if f not in sorted_features
+                if f.manifest.name not in resolved
             ]
             result.errors.append(DiscoveryError(
                 feature_path="",
@@ -197,6 +197,13 @@ class CLIIntegration:
             
         Requirements: 6.1, 6.2, 6.3, 6.4
         """
+        # AI features can rely on a client being present once they run
+        if feature.manifest.requires_api_key and not self.context.llm_client:
+            return FeatureResult(
+                success=False,
+                error="LLM client not available. Please configure an API key."
+            )
+
         try:
             # Call setup if exists
             if feature.setup:
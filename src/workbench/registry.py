@@ -9,6 +9,7 @@ Requirements: 4.1, 4.2, 4.3, 4.4, 4.5
 from typing import Optional
 import logging
 
+from src.platform.environment import get_config_dir
 from .contract import FeatureCategory
 from .discovery import LoadedFeature, DiscoveryEngine, DiscoveryResult
 
@@ -201,7 +202,7 @@ def get_registry() -> FeatureRegistry:
     global _registry
     if _registry is None:
         _registry = FeatureRegistry()
-        _registry.load()
+        _registry.load(DiscoveryEngine(cache_path=get_config_dir() / "discovery_cache.json"))
     return _registry
 
 
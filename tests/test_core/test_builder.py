@@ -40,6 +40,18 @@ class TestPromptBuilder:
         assert "Show all work" in result
         assert "Use metric units" in result
 
+    def test_constraints_rerendered_after_change(self):
+        """Test that updated constraints are reflected across techniques."""
+        config = PromptConfig(task="Review the design", constraints=["Be brief"])
+        first = self.builder.build(PromptType.ROLE_BASED, config)
+        
+        config.constraints = ["Cite sources"]
+        second = self.builder.build(PromptType.STRUCTURED, config)
+        
+        assert "- Be brief" in first
+        assert "- Cite sources" in second
+        assert "Be brief" not in second
+
     def test_build_few_shot_basic(self):
         """Test Few-Shot prompt generation."""
         config = PromptConfig(
@@ -0,0 +1,234 @@
+"""Tests for ContextManager service."""
+
+import pytest
+from src.services.context import ContextManager
+from src.services.token_counter import TokenCounter
+
+
+class FakeTokenCounter(TokenCounter):
+    """One token per character, with ids equal to the character codes."""
+
+    def count_tokens(self, text: str, model: str = "gpt-4.1") -> int:
+        return len(text)
+
+    def encode(self, text: str, model: str = "gpt-4.1") -> list[int]:
+        return [ord(ch) for ch in text]
+
+    def decode(self, tokens: list[int], model: str = "gpt-4.1") -> str:
+        return "".join(chr(t) for t in tokens)
+
+
+class TestChunkContent:
+    """Test suite for ContextManager.chunk_content."""
+
+    def setup_method(self):
+        self.counter = TokenCounter()
+        self.manager = ContextManager(self.counter)
+
+    def test_short_content_single_chunk(self):
+        """Test that short content produces one chunk."""
+        chunks = self.manager.chunk_content("First paragraph.\n\nSecond paragraph.")
+        
+        assert len(chunks) == 1
+        assert chunks[0].index == 0
+        assert "Second paragraph." in chunks[0].content
+
+    def test_blank_line_runs_collapsed(self):
+        """Test that extra blank lines don't produce empty paragraphs."""
+        chunks = self.manager.chunk_content("First.\n\n\n\n\nSecond.\n\n")
+        
+        assert chunks[0].content == "First.\n\nSecond."
+
+    def test_long_content_splits_into_chunks(self):
+        """Test that content larger than chunk_size is split."""
+        content = "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(20))
+        chunks = self.manager.chunk_content(content, chunk_size=200, overlap=0)
+        
+        assert len(chunks) > 1
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+
+    def test_chunk_token_counts_close_to_actual(self):
+        """Test that additive token tracking stays close to a full recount."""
+        content = "\n\n".join(f"Paragraph {i} " + "word " * 40 for i in range(20))
+        chunks = self.manager.chunk_content(content, chunk_size=200, overlap=10)
+        
+        for chunk in chunks:
+            actual = self.counter.count_tokens(chunk.content)
+            # One possible boundary error per paragraph and per separator
+            paragraphs = chunk.content.count("\n\n") + 1
+            assert abs(chunk.tokens - actual) <= 2 * paragraphs + 1
+
+
+class TestGetLimit:
+    """Test suite for ContextManager.get_limit."""
+
+    def test_limits_per_reserve(self):
+        """Test that cached limits are keyed by model and reserved output."""
+        manager = ContextManager(FakeTokenCounter())
+        
+        assert manager.get_limit("gpt-4o") == 120000 - 4096
+        assert manager.get_limit("gpt-4o", reserve_output=0) == 120000
+        assert manager.get_limit("unknown-model") == 8000 - 4096
+        assert manager.get_limit("gpt-4", reserve_output=7900) == 1000
+
+    @pytest.mark.parametrize("model,limit", [
+        ("claude-sonnet-4-5-20250929", 190000),
+        ("claude-opus-4-5-20251124", 190000),
+        ("gpt-4.1-mini", 1000000),
+        ("gpt-4o-2024-08-06", 120000),
+        ("o4-mini", 190000),
+        ("gemini-2.5-flash-preview", 1000000),
+    ])
+    def test_versioned_models_use_family_limit(self, model, limit):
+        """Test that unlisted model IDs inherit their family's context size."""
+        manager = ContextManager(FakeTokenCounter())
+        
+        assert manager.get_limit(model, reserve_output=0) == limit
+
+
+class TestTruncateToFit:
+    """Test suite for ContextManager.truncate_to_fit."""
+
+    def setup_method(self):
+        self.counter = TokenCounter()
+        self.manager = ContextManager(self.counter)
+        self.content = " ".join(f"word{i}" for i in range(6000))
+
+    def test_content_within_limit_untouched(self):
+        """Test that content under the limit is not truncated."""
+        result = self.manager.truncate_to_fit("Short content", model="gpt-4")
+        
+        assert not result.was_truncated
+        assert result.chunks[0].content == "Short content"
+
+    @pytest.mark.parametrize("strategy", ["end", "start", "middle"])
+    def test_truncated_content_fits(self, strategy):
+        """Test that each strategy brings content under the limit."""
+        limit = self.manager.get_limit("gpt-4")
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy=strategy)
+        
+        assert result.was_truncated
+        assert result.original_tokens > limit
+        assert result.total_tokens <= limit
+        assert "[... content truncated ...]" in result.chunks[0].content
+
+    def test_end_strategy_keeps_beginning(self):
+        """Test that the end strategy keeps the start of the content."""
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy="end")
+        
+        assert result.chunks[0].content.startswith("word0 word1")
+
+    def test_start_strategy_keeps_end(self):
+        """Test that the start strategy keeps the end of the content."""
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy="start")
+        
+        assert result.chunks[0].content.endswith("word5999")
+
+    def test_middle_strategy_keeps_both_ends(self):
+        """Test that the middle strategy keeps beginning and end."""
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy="middle")
+        
+        assert result.chunks[0].content.startswith("word0 word1")
+        assert result.chunks[0].content.endswith("word5999")
+
+
+class TestTruncateTokenSlicing:
+    """Test the token-id slicing path of truncate_to_fit."""
+
+    def setup_method(self):
+        self.counter = FakeTokenCounter()
+        self.manager = ContextManager(self.counter)
+        self.content = "".join(chr(ord("a") + i % 26) for i in range(20000))
+        self.ids = self.counter.encode(self.content)
+        self.limit = self.manager.get_limit("gpt-4")
+
+    def test_end_slices_leading_ids(self):
+        """Test that the end strategy keeps ids[:limit-50]."""
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy="end")
+        expected = self.counter.decode(self.ids[:self.limit - 50])
+        
+        assert result.chunks[0].content == expected + "\n\n[... content truncated ...]"
+        assert result.total_tokens <= self.limit
+
+    def test_start_slices_trailing_ids(self):
+        """Test that the start strategy keeps ids[-(limit-50):]."""
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy="start")
+        expected = self.counter.decode(self.ids[-(self.limit - 50):])
+        
+        assert result.chunks[0].content == "[... content truncated ...]\n\n" + expected
+        assert result.total_tokens <= self.limit
+
+    def test_middle_slices_both_ends(self):
+        """Test that the middle strategy keeps ids[:half] and ids[-half:]."""
+        half = (self.limit - 100) // 2
+        result = self.manager.truncate_to_fit(self.content, model="gpt-4", strategy="middle")
+        expected = (
+            self.counter.decode(self.ids[:half])
+            + "\n\n[... content truncated ...]\n\n"
+            + self.counter.decode(self.ids[-half:])
+        )
+        
+        assert result.chunks[0].content == expected
+        assert result.total_tokens <= self.limit
+
+
+class TestConversationContext:
+    """Test suite for ContextManager.create_conversation_context."""
+
+    def setup_method(self):
+        self.counter = FakeTokenCounter()
+        self.manager = ContextManager(self.counter)
+
+    def test_token_counts_cached_without_touching_messages(self):
+        """Test that message counts are reused without adding keys to the messages."""
+        calls = []
+        count = self.counter.count_tokens
+        self.counter.count_tokens = lambda text, model="gpt-4.1": calls.append(model) or count(text, model)
+        messages = [
+            {"role": "system", "content": "Be helpful"},
+            {"role": "user", "content": "Hello"},
+        ]
+        self.manager.create_conversation_context(messages, model="gpt-4.1")
+        result = self.manager.create_conversation_context(messages, model="gpt-4.1-mini")
+        
+        assert messages == [
+            {"role": "system", "content": "Be helpful"},
+            {"role": "user", "content": "Hello"},
+        ]
+        assert all(set(msg) == {"role", "content"} for msg in result)
+        # gpt-4.1-mini shares gpt-4.1's encoding, so the second call counts nothing
+        assert calls == ["gpt-4.1", "gpt-4.1"]
+
+    def test_token_counts_keyed_by_encoding(self):
+        """Test that a model with a different encoding recounts its messages."""
+        calls = []
+        count = self.counter.count_tokens
+        self.counter.count_tokens = lambda text, model="gpt-4.1": calls.append(model) or count(text, model)
+        messages = [{"role": "user", "content": "Hello"}]
+        self.manager.create_conversation_context(messages, model="gpt-4.1")
+        self.manager.create_conversation_context(messages, model="claude-sonnet-4-5-20250929")
+        
+        assert calls == ["gpt-4.1", "claude-sonnet-4-5-20250929"]
+
+    def test_long_history_keeps_system_and_recent(self):
+        """Test that trimming keeps the system prompt and newest messages."""
+        messages = [{"role": "system", "content": "sys"}] + [
+            {"role": "user", "content": f"{i:04d}" + "x" * 496} for i in range(20)
+        ]
+        result = self.manager.create_conversation_context(messages, model="gpt-4")
+        
+        assert result[0]["content"] == "sys"
+        assert "truncated" in result[1]["content"]
+        assert result[-1] is messages[-1]
+        assert len(result) < len(messages)
+
+    def test_trimmed_history_preserves_order_without_system(self):
+        """Test that trimmed messages stay in chronological order."""
+        messages = [
+            {"role": "user", "content": f"{i:04d}" + "x" * 996} for i in range(20)
+        ]
+        result = self.manager.create_conversation_context(messages, model="gpt-4")
+        
+        assert "truncated" in result[0]["content"]
+        kept = result[1:]
+        assert kept == messages[-len(kept):]
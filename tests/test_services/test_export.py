@@ -2,6 +2,7 @@
 
 import json
 import pytest
+from src.services import export
 from src.services.export import ExportService, ExportFormat, ExportMetadata
 
 
@@ -101,6 +102,17 @@ class TestExportService:
         assert content == "Test prompt"
 
 
+    def test_json_fallback_matches_orjson(self, monkeypatch):
+        """Test that the stdlib fallback produces the same document."""
+        metadata = ExportMetadata(technique="cot", task="Résumé", created_at="2024-01-01", tags=["a"])
+        fast, _ = ExportService.export("Prompt {x}", ExportFormat.JSON, metadata)
+        
+        monkeypatch.setattr(export, "ORJSON_AVAILABLE", False)
+        slow, _ = ExportService.export("Prompt {x}", ExportFormat.JSON, metadata)
+        
+        assert json.loads(fast) == json.loads(slow)
+
+
 class TestExportMetadata:
     """Test ExportMetadata dataclass."""
 
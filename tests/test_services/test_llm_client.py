@@ -0,0 +1,260 @@
+"""Tests for LLMClient."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+import pytest
+from src.services.llm import config as llm_config
+from src.services.llm.client import LLMClient, LLMResponse
+from src.services.llm.config import LLMConfig
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Client whose OpenAI calls are answered locally and counted."""
+    monkeypatch.setattr(llm_config, "get_config_dir", lambda: tmp_path)
+    client = LLMClient(LLMConfig())
+    client.calls = []
+
+    async def fake_openai(prompt, model, system_prompt, max_tokens, temperature):
+        client.calls.append(prompt)
+        if prompt == "fail":
+            return LLMResponse(content="", model=model, provider="openai", error="boom")
+        return LLMResponse(content=f"echo {prompt}", model=model, provider="openai")
+
+    client._complete_openai = fake_openai
+    return client
+
+
+def complete(client, prompt, **kwargs):
+    return asyncio.run(client.complete(prompt, provider="openai", model="gpt-4.1", **kwargs))
+
+
+class TestResponseCache:
+    """Test suite for the completion response cache."""
+
+    def test_deterministic_requests_reused(self, client):
+        """Test that temperature-0 repeats skip the provider call."""
+        first = complete(client, "hi", temperature=0)
+        second = complete(client, "hi", temperature=0)
+        
+        assert second is first
+        assert client.calls == ["hi"]
+
+    def test_sampled_requests_not_cached_by_default(self, client):
+        """Test that non-zero temperature always calls the provider."""
+        complete(client, "hi")
+        complete(client, "hi")
+        
+        assert client.calls == ["hi", "hi"]
+
+    def test_opt_in_cache(self, client):
+        """Test that cache=True reuses responses at any temperature."""
+        complete(client, "hi", cache=True)
+        complete(client, "hi", cache=True)
+        complete(client, "hi", cache=True, temperature=0.2)
+        
+        assert client.calls == ["hi", "hi"]
+
+    def test_errors_not_cached(self, client):
+        """Test that failed responses are retried."""
+        complete(client, "fail", temperature=0)
+        complete(client, "fail", temperature=0)
+        
+        assert client.calls == ["fail", "fail"]
+
+    def test_least_recently_used_evicted(self, client, monkeypatch):
+        """Test that the cache drops its oldest entry when full."""
+        monkeypatch.setattr("src.services.llm.client.RESPONSE_CACHE_SIZE", 2)
+        for prompt in ["a", "b", "a", "c", "a", "b"]:
+            complete(client, prompt, temperature=0)
+        
+        assert client.calls == ["a", "b", "c", "b"]
+
+
+class TestPromptCaching:
+    """Test suite for provider-side prompt caching."""
+
+    def test_anthropic_system_prompt_marked_cacheable(self, client):
+        """Test that the system prompt carries cache_control and hits are reported."""
+        sent = {}
+
+        def create(**kwargs):
+            sent.update(kwargs)
+            usage = SimpleNamespace(input_tokens=120, output_tokens=5, cache_read_input_tokens=100)
+            return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=usage)
+
+        client._clients["anthropic"] = SimpleNamespace(messages=SimpleNamespace(create=create))
+        response = asyncio.run(client.complete(
+            "hi", provider="anthropic", model="claude-haiku-4-5-20251015", system_prompt="Be brief"
+        ))
+        
+        assert sent["system"] == [
+            {"type": "text", "text": "Be brief", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert response.cached_tokens == 100
+
+    def test_openai_cached_tokens_reported(self, client):
+        """Test that OpenAI prompt cache hits are surfaced on the response."""
+        del client._complete_openai
+        usage = SimpleNamespace(
+            prompt_tokens=2000, completion_tokens=10,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1024)
+        )
+        reply = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))], usage=usage)
+        create = lambda **kwargs: reply
+        client._clients["openai"] = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        
+        response = complete(client, "hi")
+        
+        assert response.error is None
+        assert response.cached_tokens == 1024
+
+
+class TestSdkThreadPool:
+    """Test suite for running blocking SDK calls off the event loop."""
+
+    def test_sdk_call_runs_on_client_pool(self, client):
+        """Test that provider calls run on the client's own worker threads."""
+        threads = []
+
+        def create(**kwargs):
+            threads.append(threading.current_thread().name)
+            usage = SimpleNamespace(input_tokens=1, output_tokens=1, cache_read_input_tokens=None)
+            return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=usage)
+
+        client._clients["anthropic"] = SimpleNamespace(messages=SimpleNamespace(create=create))
+        response = asyncio.run(client.complete("hi", provider="anthropic", model="claude-haiku-4-5-20251015"))
+        client.close()
+        
+        assert response.cached_tokens == 0
+        assert threads[0].startswith("llm")
+
+
+class TestRefresh:
+    """Test suite for picking up changed API keys."""
+
+    def test_rekeys_existing_sdk_client(self, client):
+        """Test that a changed key is applied through with_options."""
+        rekeyed = SimpleNamespace()
+        client._clients["openai"] = SimpleNamespace(with_options=lambda api_key: (rekeyed, api_key))
+        client.config.set_api_key("openai", "sk-new")
+        client.refresh("openai")
+
+        assert client._clients["openai"] == (rekeyed, "sk-new")
+
+    def test_drops_clients_without_with_options(self, client):
+        """Test that other SDK clients are rebuilt lazily."""
+        client._clients["google"] = SimpleNamespace()
+        client._clients["openai"] = SimpleNamespace()
+        client.config.set_api_key("google", "g-key")
+        client.refresh()
+
+        assert client._clients == {}
+
+
+class FakeStream:
+    """An SDK stream that records whether it was closed."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        return self._chunks
+
+    def close(self):
+        self.closed = True
+
+
+def openai_stream_client(client, pieces, fail_after=None, streams=None):
+    """Install a fake OpenAI client that streams the given text pieces."""
+    del client._complete_openai
+    pulled = []
+
+    def create(**kwargs):
+        assert kwargs["stream"] is True
+        stream = FakeStream(chunks())
+        if streams is not None:
+            streams.append(stream)
+        return stream
+
+    def chunks():
+        for i, piece in enumerate(pieces):
+            if fail_after is not None and i == fail_after:
+                raise RuntimeError("connection reset")
+            pulled.append(piece)
+            delta = SimpleNamespace(content=piece)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)], usage=None)
+        usage = SimpleNamespace(prompt_tokens=7, completion_tokens=len(pieces), prompt_tokens_details=None)
+        yield SimpleNamespace(choices=[], usage=usage)
+
+    client._clients["openai"] = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    return pulled
+
+
+def collect(client, prompt, limit=None):
+    async def run():
+        responses = []
+        async for response in client.stream(prompt, provider="openai", model="gpt-4.1"):
+            responses.append(response)
+            if limit and len(responses) == limit:
+                break
+        return responses
+    return asyncio.run(run())
+
+
+class TestStreaming:
+    """Test suite for LLMClient.stream."""
+
+    def test_content_accumulates_and_usage_arrives_last(self, client):
+        """Test that partial responses grow and the final one has usage."""
+        openai_stream_client(client, ["Hel", "lo", "!"])
+        
+        responses = collect(client, "hi")
+        
+        assert [r.content for r in responses] == ["Hel", "Hello", "Hello!", "Hello!"]
+        assert responses[-1].input_tokens == 7
+        assert responses[-1].output_tokens == 3
+        assert responses[-1].error is None
+
+    def test_stream_error_reported_with_partial_content(self, client):
+        """Test that a mid-stream failure yields an error response."""
+        openai_stream_client(client, ["a", "b", "c"], fail_after=2)
+        
+        responses = collect(client, "hi")
+        
+        assert responses[-1].content == "ab"
+        assert responses[-1].error == "connection reset"
+
+    def test_early_exit_stops_pulling(self, client):
+        """Test that closing the stream early releases the worker thread."""
+        pulled = openai_stream_client(client, [str(i) for i in range(1000)])
+        
+        responses = collect(client, "hi", limit=2)
+        
+        assert responses[-1].content == "01"
+        assert len(pulled) < 1000
+
+    def test_early_exit_closes_sdk_stream(self, client):
+        """Test that stopping early closes the SDK's stream."""
+        streams = []
+        openai_stream_client(client, [str(i) for i in range(1000)], streams=streams)
+        
+        collect(client, "hi", limit=2)
+        
+        assert len(streams) == 1
+        assert streams[0].closed
+
+    def test_finished_stream_closed(self, client):
+        """Test that a fully read stream is closed too."""
+        streams = []
+        openai_stream_client(client, ["a", "b"], streams=streams)
+        
+        collect(client, "hi")
+        
+        assert streams[0].closed
@@ -0,0 +1,151 @@
+"""Tests for LLMConfig."""
+
+import json
+import pytest
+from src.services.llm import config as llm_config
+from src.services.llm.config import LLMConfig
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Point LLMConfig at a temporary directory with no API keys in the environment."""
+    monkeypatch.setattr(llm_config, "get_config_dir", lambda: tmp_path)
+    for info in llm_config.PROVIDERS.values():
+        monkeypatch.delenv(info["env_key"], raising=False)
+    return tmp_path
+
+
+class TestConfigFile:
+    """Test loading and saving the API config file."""
+
+    def test_save_and_reload(self, config_dir):
+        """Test that saved keys and defaults survive a reload."""
+        config = LLMConfig()
+        config.set_api_key("anthropic", "sk-test")
+        config.set_default_model("anthropic", "claude-haiku-4-5-20251015")
+        
+        reloaded = LLMConfig()
+        
+        assert reloaded.get_provider("anthropic").api_key == "sk-test"
+        assert reloaded.get_default_model() == ("anthropic", "claude-haiku-4-5-20251015")
+
+    def test_save_leaves_no_temp_file(self, config_dir):
+        """Test that saving replaces the config file atomically."""
+        LLMConfig().set_api_key("openai", "sk-test")
+        
+        assert [p.name for p in config_dir.iterdir()] == ["api_config.json"]
+        data = json.loads((config_dir / "api_config.json").read_text())
+        assert data["openai"]["api_key"] == "sk-test"
+
+    def test_stdlib_fallback_reads_same_file(self, config_dir, monkeypatch):
+        """Test that the stdlib json path reads what orjson wrote."""
+        LLMConfig().set_api_key("google", "g-key")
+        monkeypatch.setattr(llm_config, "ORJSON_AVAILABLE", False)
+        
+        assert LLMConfig().get_provider("google").api_key == "g-key"
+
+    def test_corrupt_file_ignored(self, config_dir):
+        """Test that an unreadable config file falls back to defaults."""
+        (config_dir / "api_config.json").write_text("{not json")
+        
+        config = LLMConfig()
+        
+        assert not config.has_any_provider()
+
+
+    def test_unchanged_file_parsed_once(self, config_dir, monkeypatch):
+        """Test that repeat loads of an unchanged file skip parsing."""
+        LLMConfig().set_api_key("openai", "sk-test")
+        parses = []
+        real_loads = llm_config.json.loads
+        monkeypatch.setattr(llm_config, "ORJSON_AVAILABLE", False)
+        monkeypatch.setattr(llm_config.json, "loads", lambda raw: parses.append(raw) or real_loads(raw))
+        
+        LLMConfig()
+        LLMConfig()
+        
+        assert len(parses) == 1
+
+    def test_external_edit_picked_up(self, config_dir):
+        """Test that a file changed on disk is parsed again."""
+        LLMConfig().set_api_key("openai", "sk-test")
+        path = config_dir / "api_config.json"
+        path.write_text(json.dumps({"openai": {"api_key": "sk-edited-by-hand"}}))
+        
+        assert LLMConfig().get_provider("openai").api_key == "sk-edited-by-hand"
+
+    def test_failed_save_keeps_previous_file(self, config_dir, monkeypatch):
+        """Test that a failed replace leaves the old config and no temp files."""
+        config = LLMConfig()
+        config.set_api_key("openai", "sk-old")
+        
+        def fail(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(llm_config.os, "replace", fail)
+        
+        with pytest.raises(OSError):
+            config.set_api_key("openai", "sk-new")
+        
+        assert [p.name for p in config_dir.iterdir()] == ["api_config.json"]
+        assert "sk-old" in (config_dir / "api_config.json").read_text()
+
+    def test_environment_key_overrides_file(self, config_dir, monkeypatch):
+        """Test that an API key in the environment wins over the saved one."""
+        LLMConfig().set_api_key("openai", "sk-from-file")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-from-env")
+        
+        assert LLMConfig().get_provider("openai").api_key == "sk-from-env"
+
+
+class TestDefaultModel:
+    """Test default model selection."""
+
+    def test_unknown_model_rejected(self, config_dir):
+        """Test that models outside the provider's list are refused."""
+        config = LLMConfig()
+        
+        with pytest.raises(ValueError, match="Unknown model"):
+            config.set_default_model("openai", "claude-haiku-4-5-20251015")
+
+    def test_unknown_provider_rejected(self, config_dir):
+        """Test that unknown providers are refused."""
+        with pytest.raises(ValueError, match="Unknown provider"):
+            LLMConfig().set_default_model("mistral", "large")
+
+    def test_default_change_keeps_model_list(self, config_dir):
+        """Test that changing the default doesn't rebuild the available models."""
+        config = LLMConfig()
+        config.set_api_key("google", "g-key")
+        models = config.get_available_models()
+        
+        config.set_default_model("google", "gemini-2.5-flash")
+        
+        assert config.get_available_models() is models
+        assert config.get_default_model() == ("google", "gemini-2.5-flash")
+
+    def test_lookups_refresh_after_key_change(self, config_dir):
+        """Test that memoized provider lookups see newly set keys."""
+        config = LLMConfig()
+        assert config.get_available_providers() == []
+        assert config.get_default_model() == (None, None)
+        
+        config.set_api_key("google", "g-key")
+        
+        assert config.get_available_providers() == ["google"]
+        assert config.get_default_model() == ("google", "gemini-2.5-pro")
+        assert ("google", "gemini-2.5-flash") in config.get_available_models()
+        
+        config.set_default_model("google", "gemini-2.5-flash")
+        
+        assert config.get_default_model() == ("google", "gemini-2.5-flash")
+
+    def test_revision_bumped_on_change(self, config_dir):
+        """Test that key and default changes advance the revision."""
+        config = LLMConfig()
+        start = config.revision
+        
+        config.set_api_key("google", "g-key")
+        after_key = config.revision
+        config.set_default_model("google", "gemini-2.5-flash")
+        
+        assert start < after_key < config.revision
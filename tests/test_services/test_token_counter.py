@@ -1,7 +1,10 @@
 """Tests for TokenCounter service."""
 
+import os
+from collections import OrderedDict
+
 import pytest
-from src.services.token_counter import TokenCounter, MODEL_PRICING, is_tiktoken_available
+from src.services.token_counter import TokenCounter, MODEL_PRICING, get_token_counter, is_tiktoken_available
 
 
 class TestTokenCounter:
@@ -70,10 +73,32 @@ class TestTokenCounter:
 
     def test_model_pricing_has_required_fields(self):
         """Test that all models in pricing have required fields."""
-        required_fields = {"input", "output", "encoding", "provider"}
+        required_fields = {"input_microcents", "output_microcents", "encoding", "provider"}
         
         for model, pricing in MODEL_PRICING.items():
-            assert required_fields.issubset(pricing.keys()), f"{model} missing fields"
+            assert required_fields.issubset(pricing._fields), f"{model} missing fields"
+
+    def test_model_pricing_uses_integer_microcents(self):
+        """Test that prices are stored as integer micro-cents."""
+        for model, pricing in MODEL_PRICING.items():
+            assert isinstance(pricing.input_microcents, int), model
+            assert isinstance(pricing.output_microcents, int), model
+
+    def test_cost_from_microcents(self):
+        """Test that cost is derived exactly from micro-cent prices."""
+        estimate = self.counter.estimate_cost("x" * 400, "gpt-4.1")
+        
+        assert estimate.input_cost == estimate.token_count * 200 / 100_000_000
+        assert estimate.output_cost_1k == 0.008
+
+
+class TestSharedCounter:
+    """Test the process-wide TokenCounter."""
+
+    def test_get_token_counter_returns_same_instance(self):
+        """Test that every caller gets the same counter."""
+        assert get_token_counter() is get_token_counter()
+        assert isinstance(get_token_counter(), TokenCounter)
 
 
 class TestTiktokenAvailability:
@@ -83,3 +108,191 @@ class TestTiktokenAvailability:
         """Test that availability check returns boolean."""
         result = is_tiktoken_available()
         assert isinstance(result, bool)
+
+
+class TestCountCache:
+    """Test the token count cache."""
+
+    def test_cached_count_matches_fresh_count(self):
+        """Test that repeated counts return the same value."""
+        counter = TokenCounter()
+        first = counter.count_tokens("Cache me if you can", "gpt-4.1")
+        second = counter.count_tokens("Cache me if you can", "gpt-4.1")
+        
+        assert first == second
+
+    def test_cache_clear_empties_cache(self):
+        """Test that cache_clear drops cached entries."""
+        counter = TokenCounter()
+        counter.count_tokens("Some text")
+        counter.cache_clear()
+        
+        assert len(counter._count_cache) == 0
+
+
+    def test_models_sharing_encoding_share_entries(self):
+        """Test that one encode serves every model with the same encoding."""
+        counter = TokenCounter()
+        encoder = CountingEncoder()
+        fake_encoders(counter, {"o200k_base": encoder, "cl100k_base": encoder})
+        
+        for model in ["gpt-4.1", "gpt-4.1-mini", "gpt-4o", "o4-mini"]:
+            assert counter.count_tokens("shared text", model) == 2
+        
+        assert encoder.calls == 1
+
+
+    def test_provider_estimates_encode_once_per_encoding(self):
+        """Test that estimates across providers tokenize once per encoding."""
+        counter = TokenCounter()
+        o200k, cl100k = CountingEncoder(), CountingEncoder()
+        fake_encoders(counter, {"o200k_base": o200k, "cl100k_base": cl100k})
+        
+        estimates = counter.estimate_for_providers("one two three", ["openai", "anthropic", "google"])
+        
+        assert len(estimates) == 7
+        assert all(e.token_count == 3 for e in estimates)
+        assert (o200k.calls, cl100k.calls) == (1, 1)
+
+
+    def test_counts_shared_between_instances(self):
+        """Test that a count cached by one counter serves another."""
+        first, second = TokenCounter(), TokenCounter()
+        
+        assert first._count_cache is second._count_cache
+        assert first.count_tokens("shared across counters") == second.count_tokens("shared across counters")
+
+
+    def test_encoders_shared_between_instances(self):
+        """Test that encoders load once per process, not per counter."""
+        first, second = TokenCounter(), TokenCounter()
+        first.count_tokens("warm up")
+        
+        assert first._encoders is second._encoders
+        assert second._get_encoder("o200k_base") is first._get_encoder("o200k_base")
+
+
+    def test_empty_text_skips_encoder(self):
+        """Test that empty text counts as zero without tokenizing."""
+        counter = TokenCounter()
+        encoder = CountingEncoder()
+        fake_encoders(counter, {"o200k_base": encoder})
+        
+        assert counter.count_tokens("", "gpt-4.1") == 0
+        assert counter.estimate_cost("", "gpt-4.1").input_cost == 0
+        assert encoder.calls == 0
+
+
+    def test_fallback_counts_utf8_bytes(self):
+        """Test that the no-tokenizer estimate accounts for multi-byte text."""
+        counter = TokenCounter()
+        fake_encoders(counter, {"o200k_base": None})
+        
+        assert counter.count_tokens("abcdefgh", "gpt-4.1") == 2
+        assert counter.count_tokens("你好世界你好世界", "gpt-4.1") == 6
+        assert counter.count_tokens("a", "gpt-4.1") == 1
+
+
+@pytest.mark.skipif(not is_tiktoken_available(), reason="tiktoken not installed")
+class TestEncoderLoading:
+    """Test loading encoders into the shared table."""
+
+    def test_failed_load_retried_after_backoff(self, monkeypatch):
+        """Test that a failed load isn't retried until the backoff passes."""
+        from src.services import token_counter
+        
+        attempts = []
+        now = [1000.0]
+        
+        def get_encoding(name):
+            attempts.append(name)
+            if len(attempts) == 1:
+                raise OSError("download failed")
+            return "encoder"
+        
+        monkeypatch.setattr(token_counter.tiktoken, "get_encoding", get_encoding)
+        monkeypatch.setattr(token_counter.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(token_counter, "_ENCODER_FAILURES", {})
+        encoders = {}
+        
+        assert token_counter._load_encoder(encoders, "test_base") is None
+        assert token_counter._load_encoder(encoders, "test_base") is None
+        assert attempts == ["test_base"]
+        
+        now[0] += token_counter.ENCODER_RETRY_SECONDS
+        assert token_counter._load_encoder(encoders, "test_base") == "encoder"
+        assert encoders == {"test_base": "encoder"}
+        assert attempts == ["test_base", "test_base"]
+
+    def test_load_leaves_environment_alone(self, monkeypatch):
+        """Test that loading an encoder doesn't set TIKTOKEN_CACHE_DIR."""
+        from src.services import token_counter
+        
+        monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
+        monkeypatch.setattr(token_counter.tiktoken, "get_encoding", lambda name: "encoder")
+        token_counter._load_encoder({}, "test_base")
+        
+        assert "TIKTOKEN_CACHE_DIR" not in os.environ
+
+
+class TestCountTokensIncremental:
+    """Test paragraph-wise counting."""
+
+    def test_matches_full_count(self):
+        """Test that the paragraph sum equals a whole-text count."""
+        counter = TokenCounter()
+        fake_encoders(counter, {"o200k_base": CountingEncoder()})
+        text = "Task: sort this\n\nContext: a list\n\n/path stays attached\n\nDone"
+        
+        assert counter.count_tokens_incremental(text) == len(text.split())
+
+    def test_only_changed_paragraphs_are_encoded(self):
+        """Test that growing a prompt leaves earlier paragraphs cached."""
+        counter = TokenCounter()
+        encoder = CountingEncoder()
+        fake_encoders(counter, {"o200k_base": encoder})
+        
+        counter.count_tokens_incremental("One\n\nTwo\n\nThree")
+        calls = encoder.calls
+        counter.count_tokens_incremental("One\n\nTwo\n\nThree\n\nFour")
+        
+        # "Three" gained a trailing blank line, "Four" is new
+        assert encoder.calls == calls + 2
+
+    def test_fallback_without_tokenizer(self):
+        """Test that the estimate is used when no encoder loads."""
+        counter = TokenCounter()
+        fake_encoders(counter, {"o200k_base": None})
+        
+        assert counter.count_tokens_incremental("abcdefgh\n\nabcdefgh") == counter.count_tokens("abcdefgh\n\nabcdefgh")
+        assert counter.count_tokens_incremental("") == 0
+
+
+def fake_encoders(counter, encoders):
+    """Give counter its own encoders and an empty private count cache."""
+    counter._encoders = encoders
+    counter._count_cache = OrderedDict()
+
+
+class CountingEncoder:
+    """Stand-in tiktoken encoder that splits on whitespace and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return text.split()
+
+
+class TestCountTokensBatch:
+    """Test batch token counting."""
+
+    def test_batch_matches_single_counts(self):
+        """Test that batch counts agree with count_tokens."""
+        counter = TokenCounter()
+        texts = ["alpha", "beta gamma", "", "a much longer piece of text"]
+        
+        assert counter.count_tokens_batch(texts, "gpt-4.1") == [
+            counter.count_tokens(t, "gpt-4.1") for t in texts
+        ]
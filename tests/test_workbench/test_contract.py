@@ -5,6 +5,8 @@ Property 1: Manifest Field Validation
 Validates: Requirements 1.1, 1.2, 1.4
 """
 
+import sys
+
 import pytest
 from hypothesis import given, strategies as st, settings
 
@@ -155,6 +157,35 @@ class TestFeatureManifestProperty:
         assert isinstance(manifest.category, FeatureCategory)
         assert manifest.category in list(FeatureCategory)
 
+    def test_manifest_is_read_only(self):
+        """Manifests are frozen and slotted once declared."""
+        manifest = FeatureManifest(
+            name="test",
+            display_name="Test",
+            description="Test feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.UTILITY,
+        )
+        
+        with pytest.raises(AttributeError):
+            manifest.enabled = False
+        assert not hasattr(manifest, "__dict__")
+
+    def test_name_and_color_interned(self):
+        """Names and colors built at runtime resolve to the interned strings."""
+        manifest = FeatureManifest(
+            name="".join(["te", "st"]),
+            display_name="Test",
+            description="Test feature",
+            icon="📦",
+            color="".join(["cy", "an"]),
+            category=FeatureCategory.UTILITY,
+        )
+        
+        assert manifest.name is sys.intern("test")
+        assert manifest.color is sys.intern("cyan")
+
 
 class TestFeatureResultProperty:
     """Property-based tests for FeatureResult."""
@@ -7,6 +7,7 @@ Validates: Requirements 3.1, 3.2, 3.3, 7.2, 7.4
 """
 
 import pytest
+import sys
 import tempfile
 import shutil
 from pathlib import Path
@@ -369,3 +370,174 @@ class TestDependencyResolutionProperty:
             
             # Features with missing deps should not be loaded
             assert len(result.features) == 0
+
+
+
+    def test_repeated_dependency_resolves(self, tmp_path):
+        """A dependency listed twice is still satisfied, not reported as circular."""
+        contrib_path = tmp_path / "contrib"
+        for name, deps in (("base", []), ("child", ["base", "base"])):
+            create_manifest_file(
+                contrib_path / name,
+                name=name,
+                display_name=name.title(),
+                description=f"{name} feature",
+                icon="📦",
+                color="cyan",
+                category=FeatureCategory.UTILITY,
+                dependencies=deps,
+            )
+        
+        result = DiscoveryEngine(contrib_path=contrib_path).discover()
+        
+        assert result.errors == []
+        assert [f.manifest.name for f in result.features] == ["base", "child"]
+
+def tracked_discovery(tmp_path, monkeypatch):
+    """Run a cached discovery, recording which manifests get parsed and imported."""
+    from src.workbench import discovery
+    
+    calls = {"parsed": [], "imported": []}
+    real_read = discovery._read_manifest_source
+    real_import = discovery._import_manifest
+    
+    def tracking_read(path, source):
+        calls["parsed"].append(path.name)
+        return real_read(path, source)
+    
+    def tracking_import(path):
+        calls["imported"].append(path.name)
+        return real_import(path)
+    
+    monkeypatch.setattr(discovery, "_read_manifest_source", tracking_read)
+    monkeypatch.setattr(discovery, "_import_manifest", tracking_import)
+    engine = DiscoveryEngine(contrib_path=tmp_path / "contrib", cache_path=tmp_path / "cache.json")
+    return engine.discover(), calls
+
+
+class TestDeferredImport:
+    """Tests for reading manifests without importing them."""
+
+    def test_manifest_read_from_source(self, tmp_path, monkeypatch):
+        """Discovery reads MANIFEST statically; the module is imported on first run."""
+        create_manifest_file(
+            tmp_path / "contrib" / "static_feature",
+            name="static_feature",
+            display_name="Static",
+            description="Static feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.STORAGE,
+            dependencies=[],
+        )
+        result, calls = tracked_discovery(tmp_path, monkeypatch)
+        
+        assert calls["imported"] == []
+        manifest = result.features[0].manifest
+        assert (manifest.name, manifest.category) == ("static_feature", FeatureCategory.STORAGE)
+        
+        assert result.features[0].run(None).message == "Test feature executed"
+        assert calls["imported"] == ["static_feature"]
+        
+        # Later runs reuse the imported module
+        assert result.features[0].run(None).success
+        assert calls["imported"] == ["static_feature"]
+
+    def test_dynamic_manifest_imported(self, tmp_path, monkeypatch):
+        """Manifests that need code to evaluate are imported during discovery."""
+        feature_path = tmp_path / "contrib" / "dynamic_feature"
+        create_manifest_file(
+            feature_path,
+            name="dynamic_feature",
+            display_name="Dynamic",
+            description="Dynamic feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.UTILITY,
+        )
+        source = (feature_path / "manifest.py").read_text()
+        source = source.replace('display_name="Dynamic"', 'display_name="Dynamic".upper()')
+        (feature_path / "manifest.py").write_text(source)
+        
+        result, calls = tracked_discovery(tmp_path, monkeypatch)
+        
+        assert calls["imported"] == ["dynamic_feature"]
+        assert result.features[0].manifest.display_name == "DYNAMIC"
+
+    def test_broken_deferred_import_fails_every_run(self, tmp_path, monkeypatch):
+        """A manifest whose import fails raises the same error on every run."""
+        feature_path = tmp_path / "contrib" / "broken_feature"
+        create_manifest_file(
+            feature_path,
+            name="broken_feature",
+            display_name="Broken",
+            description="Broken feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.UTILITY,
+            dependencies=[],
+        )
+        source = (feature_path / "manifest.py").read_text()
+        (feature_path / "manifest.py").write_text("import nonexistent_mod_xyz\n" + source)
+        
+        result, calls = tracked_discovery(tmp_path, monkeypatch)
+        assert calls["imported"] == []
+        
+        run = result.features[0].run
+        for _ in range(2):
+            with pytest.raises(ModuleNotFoundError, match="nonexistent_mod_xyz"):
+                run(None)
+        assert calls["imported"] == ["broken_feature", "broken_feature"]
+        assert "src.workbench.contrib.broken_feature.manifest" not in sys.modules
+
+
+class TestDiscoveryCache:
+    """Tests for reusing validated manifests across discovery runs."""
+
+    def test_unchanged_manifest_not_reread(self, tmp_path, monkeypatch):
+        """A cached manifest is rebuilt without parsing or importing it."""
+        create_manifest_file(
+            tmp_path / "contrib" / "cached_feature",
+            name="cached_feature",
+            display_name="Cached",
+            description="Cached feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.STORAGE,
+            dependencies=[],
+        )
+        first, calls = tracked_discovery(tmp_path, monkeypatch)
+        assert calls["parsed"] == ["cached_feature"]
+        
+        second, calls = tracked_discovery(tmp_path, monkeypatch)
+        assert calls == {"parsed": [], "imported": []}
+        assert second.features[0].manifest == first.features[0].manifest
+        assert second.features[0].run(None).message == "Test feature executed"
+
+    def test_edited_manifest_reread(self, tmp_path, monkeypatch):
+        """Changing manifest.py invalidates its cache entry."""
+        feature_path = tmp_path / "contrib" / "edited_feature"
+        create_manifest_file(
+            feature_path,
+            name="edited_feature",
+            display_name="Before",
+            description="Edited feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.UTILITY,
+        )
+        tracked_discovery(tmp_path, monkeypatch)
+        
+        create_manifest_file(
+            feature_path,
+            name="edited_feature",
+            display_name="After edit",
+            description="Edited feature",
+            icon="📦",
+            color="cyan",
+            category=FeatureCategory.UTILITY,
+        )
+        result, calls = tracked_discovery(tmp_path, monkeypatch)
+        
+        assert calls["parsed"] == ["edited_feature"]
+        assert result.features[0].manifest.display_name == "After edit"
@@ -0,0 +1,142 @@
+"""Tests for HistoryService search over the prompts_fts trigram index."""
+
+import sqlite3
+
+import pytest
+
+from src.workbench.contrib.history.service import HistoryService
+
+
+# The search query used before the trigram index existed
+LIKE_QUERY = "SELECT id FROM prompts WHERE task LIKE ? OR tags LIKE ? ORDER BY created_at DESC"
+
+
+def make_service(tmp_path) -> HistoryService:
+    """Create a history database, skipping if SQLite lacks FTS5 trigrams."""
+    service = HistoryService(str(tmp_path / "history.db"))
+    if not service._fts:
+        pytest.skip("SQLite build lacks FTS5 trigram support")
+    return service
+
+
+def save_dated(service: HistoryService, task: str, tags: list[str], created_at: str) -> int:
+    """Save a prompt with an explicit timestamp so result order is deterministic."""
+    prompt_id = service.save("zero_shot", task, "prompt text", tags)
+    service.execute_write("UPDATE prompts SET created_at = ? WHERE id = ?", (created_at, prompt_id))
+    return prompt_id
+
+
+def like_ids(service: HistoryService, query: str) -> list[int]:
+    return [row[0] for row in service.execute(LIKE_QUERY, (f"%{query}%", f"%{query}%"))]
+
+
+def fts_rows(service: HistoryService) -> list[tuple]:
+    """Indexed rows, after checking the index agrees with the prompts table."""
+    # integrity-check with rank 1 compares the index against its content table
+    service.execute_write("INSERT INTO prompts_fts(prompts_fts, rank) VALUES ('integrity-check', 1)")
+    return service.execute("SELECT rowid, task, tags FROM prompts_fts ORDER BY rowid")
+
+
+class TestTrigramSearch:
+    """Tests for queries answered from the trigram index."""
+
+    def test_substring_match(self, tmp_path):
+        """A query of three or more characters matches inside words, ignoring case."""
+        service = make_service(tmp_path)
+        hit = service.save("zero_shot", "Summarize the quarterly report", "p", ["finance"])
+        service.save("zero_shot", "Write a poem", "p", ["creative"])
+
+        assert [p.id for p in service.search("QUARTER")] == [hit]
+        assert [p.id for p in service.search("nanc")] == [hit]
+
+    def test_quotes_in_query(self, tmp_path):
+        """Double quotes are matched literally rather than breaking the MATCH syntax."""
+        service = make_service(tmp_path)
+        hit = service.save("zero_shot", 'Explain "async" in Python', "p", [])
+
+        assert [p.id for p in service.search('"async"')] == [hit]
+
+    def test_short_query_uses_like(self, tmp_path):
+        """Queries under three characters fall back to a LIKE scan."""
+        service = make_service(tmp_path)
+        hit = service.save("zero_shot", "Tune a DB index", "p", ["sql"])
+        service.save("zero_shot", "Write a poem", "p", [])
+
+        assert [p.id for p in service.search("db")] == [hit]
+        assert [p.id for p in service.search("q")] == [hit]
+
+    def test_order_matches_like_query(self, tmp_path):
+        """Index results come back in the same order as the LIKE query."""
+        service = make_service(tmp_path)
+        save_dated(service, "Review code changes", ["review"], "2026-01-02 10:00:00")
+        save_dated(service, "Draft release notes", ["docs", "review"], "2026-01-05 10:00:00")
+        save_dated(service, "Plan a code review", [], "2026-01-01 10:00:00")
+        save_dated(service, "Write a poem", ["creative"], "2026-01-04 10:00:00")
+        save_dated(service, "Preview the REVIEWED draft", [], "2026-01-03 10:00:00")
+
+        for query in ("review", "REVIEW", "code", "draft", "docs", "missing"):
+            assert [p.id for p in service.search(query)] == like_ids(service, query)
+
+
+class TestSearchIndexSync:
+    """Tests for the triggers that keep prompts_fts in step with prompts."""
+
+    def test_insert_update_delete(self, tmp_path):
+        """Writes to prompts are mirrored in the index."""
+        service = make_service(tmp_path)
+        prompt_id = service.save("zero_shot", "Translate a letter", "p", ["language"])
+        assert fts_rows(service) == [(prompt_id, "Translate a letter", "language")]
+
+        service.execute_write(
+            "UPDATE prompts SET task = ?, tags = ? WHERE id = ?",
+            ("Proofread an essay", "writing", prompt_id),
+        )
+        assert service.search("Translate") == []
+        assert [p.id for p in service.search("proofread")] == [prompt_id]
+        assert [p.id for p in service.search("writ")] == [prompt_id]
+        assert fts_rows(service) == [(prompt_id, "Proofread an essay", "writing")]
+
+        service.delete(prompt_id)
+        assert service.search("proofread") == []
+        assert fts_rows(service) == []
+
+    def test_favorite_toggle_keeps_index(self, tmp_path):
+        """Updates to other columns leave the indexed row intact."""
+        service = make_service(tmp_path)
+        prompt_id = service.save("zero_shot", "Outline a talk", "p", [])
+        service.toggle_favorite(prompt_id)
+
+        assert [p.id for p in service.search("outline")] == [prompt_id]
+        assert fts_rows(service) == [(prompt_id, "Outline a talk", "")]
+
+    def test_existing_rows_indexed(self, tmp_path):
+        """Opening a database created before the index backfills its rows."""
+        db_path = tmp_path / "history.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE prompts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                technique TEXT NOT NULL,
+                task TEXT NOT NULL,
+                prompt TEXT NOT NULL,
+                tags TEXT DEFAULT '',
+                is_favorite INTEGER DEFAULT 0,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO prompts (technique, task, prompt, tags) VALUES (?, ?, ?, ?)",
+            ("zero_shot", "Legacy migration plan", "p", "ops"),
+        )
+        conn.commit()
+        conn.close()
+
+        service = make_service(tmp_path)
+
+        assert [p.task for p in service.search("migration")] == ["Legacy migration plan"]
+        assert fts_rows(service) == [(1, "Legacy migration plan", "ops")]
+
+        # Reopening finds the index already in place
+        reopened = HistoryService(str(db_path))
+        assert reopened._fts
+        assert fts_rows(reopened) == [(1, "Legacy migration plan", "ops")]
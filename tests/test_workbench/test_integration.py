@@ -508,3 +508,36 @@ class TestFeatureExecutionContractProperty:
             assert error_msg in result.error, (
                 f"Feature {i}: expected '{error_msg}' in error, got '{result.error}'"
             )
+
+    def test_api_feature_not_run_without_client(self):
+        """
+        Features that require an API key are refused before run() when the
+        context has no LLM client, and run normally once one is present.
+        """
+        calls = []
+        
+        def run(ctx):
+            calls.append(ctx.llm_client)
+            return FeatureResult(success=True)
+        
+        feature = create_loaded_feature(
+            name="ai_feature",
+            display_name="AI Feature",
+            description="Needs a client",
+            icon="🔧",
+            color="cyan",
+            category=FeatureCategory.AI,
+            requires_api_key=True,
+            run_func=run,
+        )
+        console, _ = create_test_console()
+        
+        result = CLIIntegration(console=console, registry=FeatureRegistry()).execute_feature_sync(feature)
+        assert result.success is False
+        assert "LLM client" in result.error
+        assert calls == []
+        
+        client = object()
+        result = CLIIntegration(console=console, llm_client=client, registry=FeatureRegistry()).execute_feature_sync(feature)
+        assert result.success is True
+        assert calls == [client]